@@ -15,15 +15,18 @@ Usage:
 import argparse
 import os
 import sys
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from src.config.settings import REPORTS_DIR
-from src.excel_generator.converter import ExcelConverter
-from src.excel_generator.summarizer import MonthlySummarizer
 from src.pdf_processor.extractor import PDFExtractor, PDFExtractionError
 from src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from src.excel_generator.converter import ExcelConverter
+    from src.excel_generator.summarizer import MonthlySummarizer
+
 
 class BankStatementProcessor:
     """Main processor for bank statement PDF files."""
@@ -32,8 +35,20 @@ class BankStatementProcessor:
         """Initialize the processor."""
         self.logger = get_logger(__name__)
         self.extractor = PDFExtractor()
-        self.summarizer = MonthlySummarizer()
-        self.converter = ExcelConverter()
+    
+    # The report components are created on first use, so daemon runs and
+    # inputs without transactions never import openpyxl
+    @cached_property
+    def summarizer(self) -> "MonthlySummarizer":
+        """Monthly summarizer, created on first access."""
+        from src.excel_generator.summarizer import MonthlySummarizer
+        return MonthlySummarizer()
+    
+    @cached_property
+    def converter(self) -> "ExcelConverter":
+        """Excel converter, created on first access."""
+        from src.excel_generator.converter import ExcelConverter
+        return ExcelConverter()
     
     def process_single_pdf(
         self,
@@ -144,8 +159,12 @@ class BankStatementProcessor:
         # Import here to avoid circular imports
         from src.tasks.celery_app import celery_app
         
-        # Start Celery worker
-        celery_app.start(['worker', '--loglevel=info'])
+        # Start Celery worker; fair scheduling keeps long PDF tasks from
+        # blocking short ones already reserved by a busy child process
+        celery_app.start([
+            'worker', '--loglevel=info', '-O', 'fair',
+            '-Q', 'pdf_processing,chunk_processing,report_generation,celery',
+        ])
 
 
 def parse_arguments() -> argparse.Namespace:
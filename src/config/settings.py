@@ -1,12 +1,21 @@
 """Configuration settings for PDF processing system."""
 
 import os
+import sys
 import json
-from typing import Dict, Any, Optional, List
+import functools
+import operator
+from collections import ChainMap
+from typing import Dict, Any, Optional, List, Mapping, Tuple
 from pathlib import Path
 from dataclasses import dataclass, asdict, field, fields
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional faster parser
+    orjson = None
+
 # Environment variables
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 DEBUG = os.getenv("DEBUG", "False").lower() == "true"
@@ -19,9 +28,11 @@ SUPPORTED_PDF_FORMATS = [".pdf"]
 # Celery Configuration
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/0")
-CELERY_TASK_SERIALIZER = "json"
-CELERY_RESULT_SERIALIZER = "json"
-CELERY_ACCEPT_CONTENT = ["json"]
+# Set both to "orjson" only once every producer and worker has the
+# performance extra installed; workers accept either format meanwhile
+CELERY_TASK_SERIALIZER = os.getenv("CELERY_TASK_SERIALIZER", "json")
+CELERY_RESULT_SERIALIZER = os.getenv("CELERY_RESULT_SERIALIZER", "json")
+CELERY_ACCEPT_CONTENT = ["orjson", "json"]
 CELERY_TIMEZONE = "UTC"
 
 # File Paths
@@ -40,6 +51,8 @@ LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 # Excel Output Configuration
 EXCEL_OUTPUT_FORMAT = os.getenv("EXCEL_OUTPUT_FORMAT", "xlsx")
+# "xlsxwriter" streams workbooks in constant_memory mode when installed
+EXCEL_ENGINE = os.getenv("EXCEL_ENGINE", "openpyxl")
 INCLUDE_METADATA = os.getenv("INCLUDE_METADATA", "True").lower() == "true"
 
 # Currency Configuration
@@ -52,7 +65,14 @@ RETRY_DELAY_SECONDS = int(os.getenv("RETRY_DELAY_SECONDS", "60"))
 CONCURRENT_WORKERS = int(os.getenv("CONCURRENT_WORKERS", "4"))
 
 
-@dataclass
+# Precomputed exponential backoff delays in seconds, indexed by attempt - 1
+_RETRY_DELAYS = tuple(2 ** i for i in range(16))
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Settings:
     """Configuration settings class."""
     
@@ -92,36 +112,25 @@ class Settings:
     
     # Processing Configuration
     excel_output_format: str = EXCEL_OUTPUT_FORMAT
+    excel_engine: str = EXCEL_ENGINE
     include_metadata: bool = INCLUDE_METADATA
     retry_delay_seconds: int = RETRY_DELAY_SECONDS
     concurrent_workers: int = CONCURRENT_WORKERS
     
     @classmethod
-    def from_env(cls) -> "Settings":
-        """Create Settings from environment variables."""
-        return cls(
-            pdf_password=os.getenv("PDF_PASSWORD"),
-            chunk_size_mb=int(os.getenv("CHUNK_SIZE_MB", "5")),
-            max_retries=int(os.getenv("MAX_RETRIES", "3")),
-            max_pages_per_chunk=int(os.getenv("MAX_PAGES_PER_CHUNK", "50")),
-            output_dir=os.getenv("OUTPUT_DIR", "reports"),
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
-            log_format=os.getenv("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
-            currency_symbol=os.getenv("CURRENCY_SYMBOL", "KES"),
-            default_currency=os.getenv("DEFAULT_CURRENCY", "KES"),
-            base_dir=os.getenv("BASE_DIR", BASE_DIR),
-            reports_dir=os.getenv("REPORTS_DIR", REPORTS_DIR),
-            logs_dir=os.getenv("LOGS_DIR", LOGS_DIR),
-            temp_dir=os.getenv("TEMP_DIR", TEMP_DIR),
-            default_password_file=os.getenv("DEFAULT_PASSWORD_FILE", "password.txt"),
-            max_file_size_mb=int(os.getenv("MAX_FILE_SIZE_MB", "100")),
-            celery_broker_url=os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0"),
-            celery_result_backend=os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/0"),
-            excel_output_format=os.getenv("EXCEL_OUTPUT_FORMAT", "xlsx"),
-            include_metadata=os.getenv("INCLUDE_METADATA", "True").lower() == "true",
-            retry_delay_seconds=int(os.getenv("RETRY_DELAY_SECONDS", "60")),
-            concurrent_workers=int(os.getenv("CONCURRENT_WORKERS", "4")),
-        )
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "Settings":
+        """Create Settings from environment variables.
+        
+        Args:
+            env: Mapping to read variables from. Defaults to os.environ.
+            
+        Returns:
+            Settings populated from the environment.
+        """
+        if env is None:
+            env = os.environ
+        env_values = _get_settings_env_values(ChainMap(env, _SETTINGS_ENV_DEFAULTS))
+        return cls(**_parse_env_settings(env_values))
     
     def validate(self) -> bool:
         """Validate settings."""
@@ -160,10 +169,30 @@ class Settings:
         """Create settings from dictionary."""
         return cls(**data)
     
+    @classmethod
+    def from_records(cls, records: Any) -> List["Settings"]:
+        """Create one Settings per row of a numpy structured array.
+        
+        Each matching field is converted to Python values with one tolist()
+        call per column, instead of reading numpy scalars row by row.
+        
+        Args:
+            records: Structured array or recarray whose field names match
+                Settings attributes. Fields with other names are ignored.
+            
+        Returns:
+            List of Settings, one per record.
+        """
+        field_names = {f.name for f in fields(cls)}
+        names = [name for name in records.dtype.names if name in field_names]
+        columns = [records[name].tolist() for name in names]
+        return [cls(**dict(zip(names, row))) for row in zip(*columns)]
+    
     def update(self, data: Dict[str, Any]) -> None:
         """Update settings from dictionary."""
+        field_names = {f.name for f in fields(self)}
         for key, value in data.items():
-            if hasattr(self, key):
+            if key in field_names:
                 setattr(self, key, value)
     
     def clone(self) -> "Settings":
@@ -187,7 +216,67 @@ class Settings:
     def get_retry_delay(self, attempt: int) -> int:
         """Get retry delay for attempt number."""
         # Exponential backoff with minimum of 1 second
-        return max(1, 2 ** (attempt - 1))
+        if attempt < 1:
+            return 1
+        if attempt <= len(_RETRY_DELAYS):
+            return _RETRY_DELAYS[attempt - 1]
+        return 2 ** (attempt - 1)
+
+
+# (Settings field, environment variable, default) read by Settings.from_env
+_SETTINGS_ENV_FIELDS = (
+    ("pdf_password", "PDF_PASSWORD", None),
+    ("chunk_size_mb", "CHUNK_SIZE_MB", "5"),
+    ("max_retries", "MAX_RETRIES", "3"),
+    ("max_pages_per_chunk", "MAX_PAGES_PER_CHUNK", "50"),
+    ("output_dir", "OUTPUT_DIR", "reports"),
+    ("log_level", "LOG_LEVEL", "INFO"),
+    ("log_format", "LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
+    ("currency_symbol", "CURRENCY_SYMBOL", "KES"),
+    ("default_currency", "DEFAULT_CURRENCY", "KES"),
+    ("base_dir", "BASE_DIR", BASE_DIR),
+    ("reports_dir", "REPORTS_DIR", REPORTS_DIR),
+    ("logs_dir", "LOGS_DIR", LOGS_DIR),
+    ("temp_dir", "TEMP_DIR", TEMP_DIR),
+    ("default_password_file", "DEFAULT_PASSWORD_FILE", "password.txt"),
+    ("max_file_size_mb", "MAX_FILE_SIZE_MB", "100"),
+    ("celery_broker_url", "CELERY_BROKER_URL", "redis://localhost:6379/0"),
+    ("celery_result_backend", "CELERY_RESULT_BACKEND", "redis://localhost:6379/0"),
+    ("excel_output_format", "EXCEL_OUTPUT_FORMAT", "xlsx"),
+    ("excel_engine", "EXCEL_ENGINE", "openpyxl"),
+    ("include_metadata", "INCLUDE_METADATA", "True"),
+    ("retry_delay_seconds", "RETRY_DELAY_SECONDS", "60"),
+    ("concurrent_workers", "CONCURRENT_WORKERS", "4"),
+)
+_SETTINGS_ENV_FIELD_NAMES = tuple(field_name for field_name, _, _ in _SETTINGS_ENV_FIELDS)
+_SETTINGS_ENV_DEFAULTS = {env_name: default for _, env_name, default in _SETTINGS_ENV_FIELDS}
+_get_settings_env_values = operator.itemgetter(*(env_name for _, env_name, _ in _SETTINGS_ENV_FIELDS))
+_INT_ENV_FIELDS = (
+    "chunk_size_mb", "max_retries", "max_pages_per_chunk", "max_file_size_mb",
+    "retry_delay_seconds", "concurrent_workers",
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_env_settings(env_values: Tuple[Optional[str], ...]) -> Dict[str, Any]:
+    """Parse Settings keyword arguments from environment values.
+    
+    Results are cached on the exact values, so repeated from_env calls only
+    re-parse after the relevant environment changes. Callers must not mutate
+    the returned dictionary.
+    
+    Args:
+        env_values: Raw values in _SETTINGS_ENV_FIELDS order, with defaults
+            already filled in for unset variables.
+        
+    Returns:
+        Keyword arguments for Settings.
+    """
+    kwargs: Dict[str, Any] = dict(zip(_SETTINGS_ENV_FIELD_NAMES, env_values))
+    for name in _INT_ENV_FIELDS:
+        kwargs[name] = int(kwargs[name])
+    kwargs["include_metadata"] = kwargs["include_metadata"].lower() == "true"
+    return kwargs
 
 
 def get_config() -> Dict[str, Any]:
@@ -210,6 +299,7 @@ def get_config() -> Dict[str, Any]:
         "max_file_size_mb": MAX_FILE_SIZE_MB,
         "log_level": LOG_LEVEL,
         "excel_output_format": EXCEL_OUTPUT_FORMAT,
+        "excel_engine": EXCEL_ENGINE,
         "include_metadata": INCLUDE_METADATA,
         "max_retries": MAX_RETRIES,
         "retry_delay_seconds": RETRY_DELAY_SECONDS,
@@ -226,8 +316,10 @@ def ensure_directories() -> None:
 
 def load_config_from_file(file_path: str) -> Dict[str, Any]:
     """Load configuration from file."""
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    data = Path(file_path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def save_config_to_file(config: Dict[str, Any], file_path: str) -> None:
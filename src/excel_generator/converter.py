@@ -1,20 +1,67 @@
 """Excel conversion utilities for bank statement data."""
 
+import math
 import os
+from copy import copy
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, NamedTuple, Optional, Any, Tuple
 
 import pandas as pd
 from openpyxl import Workbook
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.styles.cell_style import StyleArray
 from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.dataframe import dataframe_to_rows
 
-from src.config.settings import REPORTS_DIR, EXCEL_OUTPUT_FORMAT, INCLUDE_METADATA, CURRENCY_SYMBOL
+try:
+    import xlsxwriter
+except ImportError:  # pragma: no cover - optional streaming writer
+    xlsxwriter = None
+
+from src.config.settings import (
+    REPORTS_DIR, EXCEL_OUTPUT_FORMAT, EXCEL_ENGINE, INCLUDE_METADATA, CURRENCY_SYMBOL
+)
 from src.pdf_processor.extractor import TransactionData
 from src.utils.logger import get_logger
 from src.utils.validators import ValidationError, validate_directory_path
 
 
+TRANSACTION_SHEET_COLUMNS = ["Date", "Description", "Debit", "Credit", "Balance", "Reference"]
+
+# Fixed transactions sheet widths, so large sheets are sized without scanning
+# every row; amounts leave room for the currency prefix and thousands groups
+TRANSACTION_COLUMN_WIDTHS = {
+    "Date": 12,
+    "Description": 50,
+    "Debit": 18,
+    "Credit": 18,
+    "Balance": 18,
+    "Reference": 14,
+}
+
+# Shared style objects; openpyxl styles are immutable, so every cell can reference these
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+TITLE_FONT = Font(bold=True, size=16)
+
+# Cell style keys shared by the openpyxl and xlsxwriter writers
+_HEADER_STYLE = "header"
+_TITLE_STYLE = "title"
+_DATE_STYLE = "date"
+_CURRENCY_STYLE = "currency"
+
+SUPPORTED_EXCEL_ENGINES = ("openpyxl", "xlsxwriter")
+
+
+class _StyledValue(NamedTuple):
+    """Cell value paired with the key of the style to apply to it."""
+    
+    value: Any
+    style: str
+
+
 class ExcelConversionError(Exception):
     """Custom exception for Excel conversion errors."""
     pass
@@ -23,14 +70,31 @@ class ExcelConversionError(Exception):
 class ExcelConverter:
     """Handles conversion of transaction data to Excel format."""
     
-    def __init__(self) -> None:
-        """Initialize Excel converter."""
+    def __init__(self, engine: Optional[str] = None) -> None:
+        """Initialize Excel converter.
+        
+        Args:
+            engine: Workbook writer, "openpyxl" or "xlsxwriter". Defaults to
+                the EXCEL_ENGINE setting; falls back to openpyxl when
+                xlsxwriter is not installed.
+            
+        Raises:
+            ExcelConversionError: If the engine is not supported.
+        """
         self.logger = get_logger(__name__)
         
+        engine = engine or EXCEL_ENGINE
+        if engine not in SUPPORTED_EXCEL_ENGINES:
+            raise ExcelConversionError(f"Unsupported Excel engine: {engine}")
+        if engine == "xlsxwriter" and xlsxwriter is None:
+            self.logger.warning("xlsxwriter is not installed; using openpyxl")
+            engine = "openpyxl"
+        self.engine = engine
+        
         # Define Excel styles
-        self.header_font = Font(bold=True, color="FFFFFF")
-        self.header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        self.header_alignment = Alignment(horizontal="center", vertical="center")
+        self.header_font = HEADER_FONT
+        self.header_fill = HEADER_FILL
+        self.header_alignment = HEADER_ALIGNMENT
         
         self.currency_format = f'[{CURRENCY_SYMBOL}] #,##0.00'
         self.date_format = 'YYYY-MM-DD'
@@ -73,6 +137,9 @@ class ExcelConverter:
         Returns:
             pandas DataFrame with transaction data.
         """
+        if not transactions:
+            return pd.DataFrame()
+        
         data = []
         for transaction in transactions:
             row = {
@@ -85,8 +152,45 @@ class ExcelConverter:
             }
             data.append(row)
         
-        df = pd.DataFrame(data)
+        return self._prepare_transactions_dataframe(pd.DataFrame(data))
+    
+    def dicts_to_dataframe(self, transaction_dicts: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Convert serialized transaction dictionaries to a pandas DataFrame.
+        
+        Builds the same frame as transactions_to_dataframe without first
+        rebuilding TransactionData objects.
         
+        Args:
+            transaction_dicts: Transaction dictionaries as produced by
+                TransactionData.to_dict().
+            
+        Returns:
+            pandas DataFrame with transaction data.
+        """
+        if not transaction_dicts:
+            return pd.DataFrame()
+        
+        df = pd.DataFrame.from_records(transaction_dicts, columns=TRANSACTION_SHEET_COLUMNS)
+        
+        # Empty amounts are stored as None or "", matching the falsy checks above
+        for column in ("Debit", "Credit", "Balance"):
+            df[column] = pd.to_numeric(df[column], errors="coerce")
+        df["Debit"] = df["Debit"].fillna(0.0)
+        df["Credit"] = df["Credit"].fillna(0.0)
+        df["Balance"] = df["Balance"].where(df["Balance"] != 0, None)
+        df["Reference"] = df["Reference"].fillna("")
+        
+        return self._prepare_transactions_dataframe(df)
+    
+    def _prepare_transactions_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Parse dates and sort a transactions DataFrame.
+        
+        Args:
+            df: DataFrame with transaction data.
+            
+        Returns:
+            DataFrame with a datetime Date column, sorted by date.
+        """
         # Convert date column to datetime
         if not df.empty and 'Date' in df.columns:
             df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
@@ -115,41 +219,11 @@ class ExcelConverter:
             return
         
         worksheet = workbook.create_sheet(title=sheet_name)
-        
-        # Write headers
-        headers = list(transactions_df.columns)
-        for col_num, header in enumerate(headers, 1):
-            cell = worksheet.cell(row=1, column=col_num, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.header_alignment
-        
-        # Write data
-        for row_num, row in enumerate(dataframe_to_rows(transactions_df, index=False, header=False), 2):
-            for col_num, value in enumerate(row, 1):
-                cell = worksheet.cell(row=row_num, column=col_num, value=value)
-                
-                # Apply formatting based on column type
-                if col_num == 1 and isinstance(value, datetime):  # Date column
-                    cell.number_format = self.date_format
-                elif col_num in [3, 4, 5] and isinstance(value, (int, float)):  # Amount columns
-                    cell.number_format = self.currency_format
-        
-        # Auto-adjust column widths using column letters directly
-        for col_idx in range(1, worksheet.max_column + 1):
-            max_length = 0
-            column_letter = chr(64 + col_idx)  # Convert to A, B, C, etc.
-            
-            for row_idx in range(1, worksheet.max_row + 1):
-                cell = worksheet.cell(row=row_idx, column=col_idx)
-                try:
-                    if cell.value and len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            
-            adjusted_width = min(max_length + 2, 50)
-            worksheet.column_dimensions[column_letter].width = adjusted_width
+        self._append_rows(
+            worksheet,
+            self._transactions_rows(transactions_df),
+            widths=self._transactions_column_widths(transactions_df.columns)
+        )
         
         self.logger.info(f"Created transactions sheet with {len(transactions_df)} rows")
     
@@ -167,44 +241,162 @@ class ExcelConverter:
             sheet_name: Name for the sheet.
         """
         worksheet = workbook.create_sheet(title=sheet_name)
+        self._append_rows(worksheet, self._metadata_rows(metadata))
+        
+        self.logger.info(f"Created metadata sheet with {len(metadata)} items")
+    
+    def _transactions_rows(self, transactions_df: pd.DataFrame) -> List[List[Any]]:
+        """Build the transactions sheet rows, header first.
+        
+        Args:
+            transactions_df: DataFrame with transaction data.
+            
+        Returns:
+            Row values, with styled cells wrapped in _StyledValue.
+        """
+        rows = [[_StyledValue(header, _HEADER_STYLE) for header in transactions_df.columns]]
+        
+        for row in dataframe_to_rows(transactions_df, index=False, header=False):
+            for col_idx, value in enumerate(row):
+                # Apply formatting based on column type
+                if col_idx == 0 and isinstance(value, datetime):  # Date column
+                    row[col_idx] = _StyledValue(value, _DATE_STYLE)
+                elif col_idx in (2, 3, 4) and isinstance(value, (int, float)):  # Amount columns
+                    row[col_idx] = _StyledValue(value, _CURRENCY_STYLE)
+            rows.append(row)
+        
+        return rows
+    
+    def _transactions_column_widths(self, columns: Iterable[Any]) -> List[int]:
+        """Look up the transactions sheet column widths by header.
+        
+        Args:
+            columns: Transactions DataFrame column headers.
+            
+        Returns:
+            Width for each column, first column first; columns without a
+            fixed width are sized to their header.
+        """
+        return [
+            TRANSACTION_COLUMN_WIDTHS.get(column, min(len(str(column)) + 2, 50))
+            for column in columns
+        ]
+    
+    def _metadata_rows(self, metadata: Dict[str, Any]) -> List[List[Any]]:
+        """Build the metadata sheet rows, formatting the first as a header.
         
-        # Write metadata
-        row_num = 1
-        for key, value in metadata.items():
-            worksheet.cell(row=row_num, column=1, value=str(key))
-            worksheet.cell(row=row_num, column=2, value=str(value))
-            
-            # Format header row
-            if row_num == 1:
-                cell = worksheet.cell(row=row_num, column=1)
-                cell.font = self.header_font
-                cell.fill = self.header_fill
-                cell.alignment = self.header_alignment
-                
-                cell = worksheet.cell(row=row_num, column=2)
-                cell.font = self.header_font
-                cell.fill = self.header_fill
-                cell.alignment = self.header_alignment
-            
-            row_num += 1
-        
-        # Auto-adjust column widths using column letters directly
-        for col_idx in range(1, worksheet.max_column + 1):
-            max_length = 0
-            column_letter = chr(64 + col_idx)  # Convert to A, B, C, etc.
-            
-            for row_idx in range(1, worksheet.max_row + 1):
-                cell = worksheet.cell(row=row_idx, column=col_idx)
+        Args:
+            metadata: Dictionary with metadata information.
+            
+        Returns:
+            Row values, with styled cells wrapped in _StyledValue.
+        """
+        rows: List[List[Any]] = [[str(key), str(value)] for key, value in metadata.items()]
+        if rows:
+            rows[0] = [_StyledValue(value, _HEADER_STYLE) for value in rows[0]]
+        return rows
+    
+    def _column_widths(
+        self,
+        rows: List[List[Any]],
+        merges: Optional[Dict[int, int]] = None
+    ) -> List[int]:
+        """Size columns to their longest value, capped at 50 characters.
+        
+        Args:
+            rows: Row values that will be written to the sheet.
+            merges: Merged header ranges as {row number: last column}.
+            
+        Returns:
+            Width for each column, first column first.
+        """
+        max_lengths = [0] * max(merges.values(), default=0) if merges else []
+        for row in rows:
+            if len(row) > len(max_lengths):
+                max_lengths.extend([0] * (len(row) - len(max_lengths)))
+            for col_idx, value in enumerate(row):
+                if isinstance(value, _StyledValue):
+                    value = value.value
                 try:
-                    if cell.value and len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
+                    if value and len(str(value)) > max_lengths[col_idx]:
+                        max_lengths[col_idx] = len(str(value))
+                except (TypeError, ValueError):
                     pass
+        
+        return [min(max_length + 2, 50) for max_length in max_lengths]
+    
+    def _openpyxl_cell(
+        self,
+        worksheet,
+        styled: _StyledValue,
+        style_cache: Dict[str, StyleArray]
+    ) -> Cell:
+        """Create a styled openpyxl cell for appending to a worksheet.
+        
+        Args:
+            worksheet: Worksheet the cell will be appended to.
+            styled: Value and style key.
+            style_cache: Style arrays already resolved for this worksheet's
+                workbook, keyed by style key; filled in on first use.
             
-            adjusted_width = min(max_length + 2, 50)
-            worksheet.column_dimensions[column_letter].width = adjusted_width
+        Returns:
+            Styled cell usable on regular and write-only worksheets.
+        """
+        cell = WriteOnlyCell(worksheet, value=styled.value)
         
-        self.logger.info(f"Created metadata sheet with {len(metadata)} items")
+        # Resolving fonts and number formats against the workbook's style
+        # tables is the expensive part, so do it once per style key
+        style = style_cache.get(styled.style)
+        if style is not None:
+            cell._style = copy(style)
+            return cell
+        
+        if styled.style == _HEADER_STYLE:
+            cell.font = self.header_font
+            cell.fill = self.header_fill
+            cell.alignment = self.header_alignment
+        elif styled.style == _TITLE_STYLE:
+            cell.font = TITLE_FONT
+        elif styled.style == _DATE_STYLE:
+            cell.number_format = self.date_format
+        elif styled.style == _CURRENCY_STYLE:
+            cell.number_format = self.currency_format
+        style_cache[styled.style] = copy(cell._style)
+        return cell
+    
+    def _append_rows(
+        self,
+        worksheet,
+        rows: List[List[Any]],
+        merges: Optional[Dict[int, int]] = None,
+        widths: Optional[List[int]] = None
+    ) -> None:
+        """Size columns, then append rows to an openpyxl worksheet.
+        
+        Args:
+            worksheet: Regular or write-only openpyxl worksheet.
+            rows: Row values, with styled cells wrapped in _StyledValue.
+            merges: Merged header ranges as {row number: last column};
+                regular worksheets only.
+            widths: Column widths; measured from the rows when omitted.
+        """
+        if widths is None:
+            widths = self._column_widths(rows, merges)
+        
+        # Widths must be set before the first row on write-only sheets
+        for col_idx, width in enumerate(widths, 1):
+            worksheet.column_dimensions[get_column_letter(col_idx)].width = width
+        
+        style_cache = {}
+        for row in rows:
+            worksheet.append([
+                self._openpyxl_cell(worksheet, value, style_cache)
+                if isinstance(value, _StyledValue) else value
+                for value in row
+            ])
+        
+        for row_num, last_column in (merges or {}).items():
+            worksheet.merge_cells(start_row=row_num, start_column=1, end_row=row_num, end_column=last_column)
     
     def convert_to_excel(
         self,
@@ -228,42 +420,10 @@ class ExcelConverter:
             ExcelConversionError: If conversion fails.
         """
         try:
-            # Validate output directory
-            if output_path is None:
-                output_path = REPORTS_DIR
-            
-            validate_directory_path(output_path)
-            
-            # Generate filename if not provided
-            if filename is None:
-                filename = self.generate_filename("bank_statement")
-            
-            # Ensure filename has correct extension
-            if not filename.endswith(f".{EXCEL_OUTPUT_FORMAT}"):
-                filename = f"{filename}.{EXCEL_OUTPUT_FORMAT}"
-            
-            full_path = os.path.join(output_path, filename)
-            
-            # Convert transactions to DataFrame
-            transactions_df = self.transactions_to_dataframe(transactions)
-            
-            # Create workbook
-            workbook = Workbook()
-            
-            # Remove default sheet
-            if "Sheet" in workbook.sheetnames:
-                workbook.remove(workbook["Sheet"])
-            
-            # Create transactions sheet
-            self.create_transactions_sheet(workbook, transactions_df)
-            
-            # Create metadata sheet if enabled
-            if INCLUDE_METADATA and metadata:
-                self.create_metadata_sheet(workbook, metadata)
-            
-            # Save workbook
-            workbook.save(full_path)
-            workbook.close()
+            full_path = self._write_workbook(
+                self.transactions_to_dataframe(transactions),
+                output_path, filename, "bank_statement", metadata=metadata
+            )
             
             self.logger.info(f"Excel file created successfully: {full_path}")
             return full_path
@@ -295,49 +455,238 @@ class ExcelConverter:
             ExcelConversionError: If creation fails.
         """
         try:
-            # Validate output directory
-            if output_path is None:
-                output_path = REPORTS_DIR
+            full_path = self._write_workbook(
+                self.transactions_to_dataframe(transactions),
+                output_path, filename, "bank_summary", summary_data=summary_data
+            )
             
-            validate_directory_path(output_path)
-            
-            # Generate filename if not provided
-            if filename is None:
-                filename = self.generate_filename("bank_summary")
+            self.logger.info(f"Summary Excel file created successfully: {full_path}")
+            return full_path
             
-            # Ensure filename has correct extension
-            if not filename.endswith(f".{EXCEL_OUTPUT_FORMAT}"):
-                filename = f"{filename}.{EXCEL_OUTPUT_FORMAT}"
+        except ValidationError as e:
+            raise ExcelConversionError(f"Validation error: {str(e)}")
+        except Exception as e:
+            raise ExcelConversionError(f"Failed to create summary Excel: {str(e)}")
+    
+    def convert_from_dicts(
+        self,
+        transaction_dicts: List[Dict[str, Any]],
+        summary_data: Optional[Dict[str, Any]] = None,
+        output_path: Optional[str] = None,
+        filename: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Create an Excel file directly from serialized transactions.
+        
+        Args:
+            transaction_dicts: Transaction dictionaries as produced by
+                TransactionData.to_dict().
+            summary_data: Optional summary information; adds a summary sheet.
+            output_path: Optional output directory path.
+            filename: Optional filename for output file.
+            metadata: Optional metadata to include when there is no summary.
             
-            full_path = os.path.join(output_path, filename)
+        Returns:
+            Path to created Excel file.
             
-            # Convert transactions to DataFrame
-            transactions_df = self.transactions_to_dataframe(transactions)
+        Raises:
+            ExcelConversionError: If conversion fails.
+        """
+        try:
+            transactions_df = self.dicts_to_dataframe(transaction_dicts)
+            if summary_data:
+                full_path = self._write_workbook(
+                    transactions_df, output_path, filename, "bank_summary",
+                    summary_data=summary_data
+                )
+            else:
+                full_path = self._write_workbook(
+                    transactions_df, output_path, filename, "bank_statement",
+                    metadata=metadata
+                )
             
-            # Create workbook
-            workbook = Workbook()
+            self.logger.info(f"Excel file created successfully: {full_path}")
+            return full_path
             
-            # Remove default sheet
-            if "Sheet" in workbook.sheetnames:
-                workbook.remove(workbook["Sheet"])
+        except ValidationError as e:
+            raise ExcelConversionError(f"Validation error: {str(e)}")
+        except Exception as e:
+            raise ExcelConversionError(f"Failed to convert to Excel: {str(e)}")
+    
+    def _write_workbook(
+        self,
+        transactions_df: pd.DataFrame,
+        output_path: Optional[str],
+        filename: Optional[str],
+        base_name: str,
+        summary_data: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Write the report workbook and return its path.
+        
+        Args:
+            transactions_df: DataFrame with transaction data.
+            output_path: Optional output directory path.
+            filename: Optional filename for output file.
+            base_name: Base filename used when filename is not provided.
+            summary_data: Optional summary information for a summary sheet.
+            metadata: Optional metadata for a metadata sheet.
             
-            # Create summary sheet
+        Returns:
+            Path to created Excel file.
+        """
+        # Validate output directory
+        if output_path is None:
+            output_path = REPORTS_DIR
+        
+        validate_directory_path(output_path)
+        
+        # Generate filename if not provided
+        if filename is None:
+            filename = self.generate_filename(base_name)
+        
+        # Ensure filename has correct extension
+        if not filename.endswith(f".{EXCEL_OUTPUT_FORMAT}"):
+            filename = f"{filename}.{EXCEL_OUTPUT_FORMAT}"
+        
+        full_path = os.path.join(output_path, filename)
+        
+        if self.engine == "xlsxwriter":
+            self._write_xlsxwriter_workbook(full_path, transactions_df, summary_data, metadata)
+            return full_path
+        
+        # Stream rows to disk unless the summary sheet needs random access
+        workbook = Workbook(write_only=summary_data is None)
+        
+        # Remove default sheet
+        if "Sheet" in workbook.sheetnames:
+            workbook.remove(workbook["Sheet"])
+        
+        # Create summary sheet
+        if summary_data is not None:
             self.create_summary_sheet(workbook, summary_data)
+        
+        # Create transactions sheet
+        self.create_transactions_sheet(workbook, transactions_df)
+        
+        # Create metadata sheet if enabled
+        if INCLUDE_METADATA and metadata:
+            self.create_metadata_sheet(workbook, metadata)
+        
+        # Save workbook
+        workbook.save(full_path)
+        workbook.close()
+        
+        return full_path
+    
+    def _write_xlsxwriter_workbook(
+        self,
+        full_path: str,
+        transactions_df: pd.DataFrame,
+        summary_data: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Write the report workbook with xlsxwriter in constant_memory mode.
+        
+        Each row is flushed to disk once the next row starts, so memory stays
+        flat regardless of the number of transactions.
+        
+        Args:
+            full_path: Path of the Excel file to create.
+            transactions_df: DataFrame with transaction data.
+            summary_data: Optional summary information for a summary sheet.
+            metadata: Optional metadata for a metadata sheet.
+        """
+        workbook = xlsxwriter.Workbook(full_path, {
+            "constant_memory": True,
+            "strings_to_urls": False,
+            "nan_inf_to_errors": True,
+        })
+        formats = {
+            _HEADER_STYLE: workbook.add_format({
+                "bold": True,
+                "font_color": "#FFFFFF",
+                "bg_color": "#366092",
+                "pattern": 1,
+                "align": "center",
+                "valign": "vcenter",
+            }),
+            _TITLE_STYLE: workbook.add_format({"bold": True, "font_size": 16}),
+            _DATE_STYLE: workbook.add_format({"num_format": self.date_format}),
+            _CURRENCY_STYLE: workbook.add_format({"num_format": self.currency_format}),
+        }
+        
+        try:
+            # Create summary sheet
+            if summary_data is not None:
+                rows, merges = self._summary_rows(summary_data)
+                self._write_xlsxwriter_sheet(workbook, formats, "Summary", rows, merges)
+                self.logger.info("Created summary sheet with comprehensive data")
             
             # Create transactions sheet
-            self.create_transactions_sheet(workbook, transactions_df)
+            if transactions_df.empty:
+                self.logger.warning("No transaction data to write to Excel")
+            else:
+                rows = self._transactions_rows(transactions_df)
+                widths = self._transactions_column_widths(transactions_df.columns)
+                self._write_xlsxwriter_sheet(workbook, formats, "Transactions", rows, widths=widths)
+                self.logger.info(f"Created transactions sheet with {len(transactions_df)} rows")
             
-            # Save workbook
-            workbook.save(full_path)
+            # Create metadata sheet if enabled
+            if INCLUDE_METADATA and metadata:
+                rows = self._metadata_rows(metadata)
+                self._write_xlsxwriter_sheet(workbook, formats, "Metadata", rows)
+                self.logger.info(f"Created metadata sheet with {len(metadata)} items")
+        finally:
             workbook.close()
-            
-            self.logger.info(f"Summary Excel file created successfully: {full_path}")
-            return full_path
-            
-        except ValidationError as e:
-            raise ExcelConversionError(f"Validation error: {str(e)}")
-        except Exception as e:
-            raise ExcelConversionError(f"Failed to create summary Excel: {str(e)}")
+    
+    def _write_xlsxwriter_sheet(
+        self,
+        workbook,
+        formats: Dict[str, Any],
+        sheet_name: str,
+        rows: List[List[Any]],
+        merges: Optional[Dict[int, int]] = None,
+        widths: Optional[List[int]] = None
+    ) -> None:
+        """Write rows to a new xlsxwriter worksheet in ascending row order.
+        
+        Args:
+            workbook: xlsxwriter workbook object.
+            formats: xlsxwriter formats keyed by style.
+            sheet_name: Name for the sheet.
+            rows: Row values, with styled cells wrapped in _StyledValue.
+            merges: Merged header ranges as {row number: last column}.
+            widths: Column widths; measured from the rows when omitted.
+        """
+        worksheet = workbook.add_worksheet(sheet_name)
+        merges = merges or {}
+        if widths is None:
+            widths = self._column_widths(rows, merges)
+        
+        for col_idx, width in enumerate(widths):
+            worksheet.set_column(col_idx, col_idx, width)
+        
+        for row_idx, row in enumerate(rows):
+            for col_idx, value in enumerate(row):
+                cell_format = None
+                if isinstance(value, _StyledValue):
+                    value, cell_format = value.value, formats[value.style]
+                if value is None or value is pd.NaT or (isinstance(value, float) and math.isnan(value)):
+                    # Missing values become blank cells, keeping their format
+                    if cell_format is not None:
+                        worksheet.write_blank(row_idx, col_idx, None, cell_format)
+                    continue
+                worksheet.write(row_idx, col_idx, value, cell_format)
+            
+            # constant_memory only allows merging within the current row
+            last_column = merges.get(row_idx + 1)
+            if last_column and row:
+                first = row[0]
+                if isinstance(first, _StyledValue):
+                    worksheet.merge_range(row_idx, 0, row_idx, last_column - 1, first.value, formats[first.style])
+                else:
+                    worksheet.merge_range(row_idx, 0, row_idx, last_column - 1, first)
     
     def create_summary_sheet(
         self,
@@ -353,162 +702,136 @@ class ExcelConverter:
             sheet_name: Name for the sheet.
         """
         worksheet = workbook.create_sheet(title=sheet_name)
-        row_num = 1
+        rows, merges = self._summary_rows(summary_data)
+        self._append_rows(worksheet, rows, merges)
+        
+        self.logger.info(f"Created summary sheet with comprehensive data")
+    
+    def _summary_rows(
+        self,
+        summary_data: Dict[str, Any]
+    ) -> Tuple[List[List[Any]], Dict[int, int]]:
+        """Build the summary sheet rows and merged header ranges.
         
+        Args:
+            summary_data: Dictionary with summary information.
+            
+        Returns:
+            Tuple of row values and merged ranges as {row number: last column}.
+        """
         # Title
-        title_cell = worksheet.cell(row=row_num, column=1, value="Bank Statement Summary")
-        title_cell.font = Font(bold=True, size=16)
-        worksheet.merge_cells(start_row=row_num, start_column=1, end_row=row_num, end_column=3)
-        row_num += 2
+        rows: List[List[Any]] = [[_StyledValue("Bank Statement Summary", _TITLE_STYLE)], []]
+        merges = {1: 3}
         
         # Overall Summary Section
-        self._write_overall_summary(worksheet, summary_data, row_num)
-        row_num += 8
+        merges[len(rows) + 1] = 3
+        rows.extend(self._pad_rows(self._overall_summary_rows(summary_data), 8))
         
         # Analysis Period Section
         if "analysis_period" in summary_data:
-            self._write_analysis_period(worksheet, summary_data["analysis_period"], row_num)
-            row_num += 5
+            merges[len(rows) + 1] = 3
+            rows.extend(self._pad_rows(self._analysis_period_rows(summary_data["analysis_period"]), 5))
         
         # Monthly Summaries Section
         if "monthly_summaries" in summary_data:
-            row_num = self._write_monthly_summaries(worksheet, summary_data["monthly_summaries"], row_num)
+            merges[len(rows) + 1] = 5
+            rows.extend(self._monthly_summaries_rows(summary_data["monthly_summaries"]))
         
-        # Auto-adjust column widths
-        for col_idx in range(1, worksheet.max_column + 1):
-            max_length = 0
-            column_letter = chr(64 + col_idx)  # Convert to A, B, C, etc.
-            
-            for row_idx in range(1, worksheet.max_row + 1):
-                cell = worksheet.cell(row=row_idx, column=col_idx)
-                try:
-                    if cell.value and len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
+        return rows, merges
+    
+    def _pad_rows(self, rows: List[List[Any]], height: int) -> List[List[Any]]:
+        """Pad a section with empty rows to a fixed height.
+        
+        Args:
+            rows: Section rows.
+            height: Number of rows the section occupies.
             
-            adjusted_width = min(max_length + 2, 50)
-            worksheet.column_dimensions[column_letter].width = adjusted_width
+        Returns:
+            Section rows followed by empty rows.
+        """
+        return rows + [[] for _ in range(height - len(rows))]
+    
+    def _section_header_rows(self, title: str) -> List[List[Any]]:
+        """Build a section header row followed by a blank row.
         
-        self.logger.info(f"Created summary sheet with comprehensive data")
+        Args:
+            title: Section title.
+            
+        Returns:
+            Header rows.
+        """
+        return [[_StyledValue(title, _HEADER_STYLE)], []]
     
-    def _write_overall_summary(
-        self,
-        worksheet,
-        summary_data: Dict[str, Any],
-        start_row: int
-    ) -> None:
-        """Write overall summary section.
+    def _overall_summary_rows(self, summary_data: Dict[str, Any]) -> List[List[Any]]:
+        """Build overall summary section rows.
         
         Args:
-            worksheet: Excel worksheet object.
             summary_data: Summary data dictionary.
-            start_row: Starting row number.
+            
+        Returns:
+            Section rows, header first.
         """
         # Section header
-        header_cell = worksheet.cell(row=start_row, column=1, value="Overall Summary")
-        header_cell.font = self.header_font
-        header_cell.fill = self.header_fill
-        header_cell.alignment = self.header_alignment
-        worksheet.merge_cells(start_row=start_row, start_column=1, end_row=start_row, end_column=3)
+        rows = self._section_header_rows("Overall Summary")
         
         # Overall totals
         if "overall_totals" in summary_data:
             totals = summary_data["overall_totals"]
-            row = start_row + 2
-            
-            worksheet.cell(row=row, column=1, value="Total Transactions:")
-            worksheet.cell(row=row, column=2, value=summary_data.get("total_transactions", 0))
-            row += 1
-            
-            worksheet.cell(row=row, column=1, value="Total Credits:")
-            worksheet.cell(row=row, column=2, value=f"{CURRENCY_SYMBOL} {totals.get('total_credits', 0):,.2f}")
-            row += 1
-            
-            worksheet.cell(row=row, column=1, value="Total Debits:")
-            worksheet.cell(row=row, column=2, value=f"{CURRENCY_SYMBOL} {totals.get('total_debits', 0):,.2f}")
-            row += 1
-            
-            worksheet.cell(row=row, column=1, value="Net Amount:")
-            worksheet.cell(row=row, column=2, value=f"{CURRENCY_SYMBOL} {totals.get('net_amount', 0):,.2f}")
-            row += 1
-            
-            worksheet.cell(row=row, column=1, value="Average Monthly Transactions:")
-            worksheet.cell(row=row, column=2, value=f"{summary_data.get('average_monthly_transactions', 0):.1f}")
+            rows.extend([
+                ["Total Transactions:", summary_data.get("total_transactions", 0)],
+                ["Total Credits:", f"{CURRENCY_SYMBOL} {totals.get('total_credits', 0):,.2f}"],
+                ["Total Debits:", f"{CURRENCY_SYMBOL} {totals.get('total_debits', 0):,.2f}"],
+                ["Net Amount:", f"{CURRENCY_SYMBOL} {totals.get('net_amount', 0):,.2f}"],
+                ["Average Monthly Transactions:", f"{summary_data.get('average_monthly_transactions', 0):.1f}"],
+            ])
+        
+        return rows
     
-    def _write_analysis_period(
-        self,
-        worksheet,
-        analysis_period: Dict[str, Any],
-        start_row: int
-    ) -> None:
-        """Write analysis period section.
+    def _analysis_period_rows(self, analysis_period: Dict[str, Any]) -> List[List[Any]]:
+        """Build analysis period section rows.
         
         Args:
-            worksheet: Excel worksheet object.
             analysis_period: Analysis period data.
-            start_row: Starting row number.
+            
+        Returns:
+            Section rows, header first.
         """
         # Section header
-        header_cell = worksheet.cell(row=start_row, column=1, value="Analysis Period")
-        header_cell.font = self.header_font
-        header_cell.fill = self.header_fill
-        header_cell.alignment = self.header_alignment
-        worksheet.merge_cells(start_row=start_row, start_column=1, end_row=start_row, end_column=3)
+        rows = self._section_header_rows("Analysis Period")
         
         # Period details
-        row = start_row + 2
-        worksheet.cell(row=row, column=1, value="Start Date:")
-        worksheet.cell(row=row, column=2, value=analysis_period.get("start_date", "N/A"))
-        row += 1
-        
-        worksheet.cell(row=row, column=1, value="End Date:")
-        worksheet.cell(row=row, column=2, value=analysis_period.get("end_date", "N/A"))
-        row += 1
+        rows.extend([
+            ["Start Date:", analysis_period.get("start_date", "N/A")],
+            ["End Date:", analysis_period.get("end_date", "N/A")],
+            ["Total Days:", analysis_period.get("total_days", 0)],
+        ])
         
-        worksheet.cell(row=row, column=1, value="Total Days:")
-        worksheet.cell(row=row, column=2, value=analysis_period.get("total_days", 0))
+        return rows
     
-    def _write_monthly_summaries(
-        self,
-        worksheet,
-        monthly_summaries: Dict[str, Dict[str, Any]],
-        start_row: int
-    ) -> int:
-        """Write monthly summaries section.
+    def _monthly_summaries_rows(self, monthly_summaries: Dict[str, Dict[str, Any]]) -> List[List[Any]]:
+        """Build monthly summaries section rows.
         
         Args:
-            worksheet: Excel worksheet object.
             monthly_summaries: Monthly summary data.
-            start_row: Starting row number.
             
         Returns:
-            Next available row number.
+            Section rows, header first.
         """
         # Section header
-        header_cell = worksheet.cell(row=start_row, column=1, value="Monthly Breakdown")
-        header_cell.font = self.header_font
-        header_cell.fill = self.header_fill
-        header_cell.alignment = self.header_alignment
-        worksheet.merge_cells(start_row=start_row, start_column=1, end_row=start_row, end_column=5)
+        rows = self._section_header_rows("Monthly Breakdown")
         
         # Table headers
-        row = start_row + 2
         headers = ["Month", "Transactions", "Total Credits", "Total Debits", "Net Amount"]
-        for col, header in enumerate(headers, 1):
-            cell = worksheet.cell(row=row, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.header_alignment
+        rows.append([_StyledValue(header, _HEADER_STYLE) for header in headers])
         
         # Monthly data
-        row += 1
         for month, data in sorted(monthly_summaries.items()):
-            worksheet.cell(row=row, column=1, value=data.get("month", month))
-            worksheet.cell(row=row, column=2, value=data.get("transaction_count", 0))
-            worksheet.cell(row=row, column=3, value=f"{CURRENCY_SYMBOL} {data.get('total_credits', 0):,.2f}")
-            worksheet.cell(row=row, column=4, value=f"{CURRENCY_SYMBOL} {data.get('total_debits', 0):,.2f}")
-            worksheet.cell(row=row, column=5, value=f"{CURRENCY_SYMBOL} {data.get('net_amount', 0):,.2f}")
-            row += 1
-        
-        return row + 2
\ No newline at end of file
+            rows.append([
+                data.get("month", month),
+                data.get("transaction_count", 0),
+                f"{CURRENCY_SYMBOL} {data.get('total_credits', 0):,.2f}",
+                f"{CURRENCY_SYMBOL} {data.get('total_debits', 0):,.2f}",
+                f"{CURRENCY_SYMBOL} {data.get('net_amount', 0):,.2f}",
+            ])
+        
+        return rows
@@ -1,8 +1,10 @@
 """Monthly summary calculation utilities for bank statement data."""
 
+import functools
+import heapq
 from collections import defaultdict
+from operator import attrgetter
 from datetime import datetime
-from decimal import Decimal
 from typing import Dict, List, Optional, Any, Tuple
 
 import pandas as pd
@@ -11,6 +13,24 @@ from src.pdf_processor.extractor import TransactionData
 from src.utils.logger import get_logger
 
 
+@functools.lru_cache(maxsize=8192)
+def _month_key(date_str: str) -> str:
+    """Return the YYYY-MM month key for a YYYY-MM-DD date string.
+    
+    Memoized per input string, since statements repeat the same dates.
+    
+    Args:
+        date_str: Transaction date.
+        
+    Returns:
+        Month key.
+        
+    Raises:
+        ValueError: If the date does not match YYYY-MM-DD.
+    """
+    return datetime.strptime(date_str, "%Y-%m-%d").strftime("%Y-%m")
+
+
 class SummaryCalculationError(Exception):
     """Custom exception for summary calculation errors."""
     pass
@@ -40,13 +60,11 @@ class MonthlySummarizer:
         for transaction in transactions:
             try:
                 # Parse date and extract month
-                date_obj = datetime.strptime(transaction.date, "%Y-%m-%d")
-                month_key = date_obj.strftime("%Y-%m")
-                monthly_groups[month_key].append(transaction)
-                
+                month_key = _month_key(transaction.date)
             except ValueError as e:
                 self.logger.warning(f"Failed to parse date {transaction.date}: {str(e)}")
                 continue
+            monthly_groups[month_key].append(transaction)
         
         # Convert defaultdict to regular dict and sort by month
         result = dict(sorted(monthly_groups.items()))
@@ -66,9 +84,8 @@ class MonthlySummarizer:
         Returns:
             Dictionary with monthly totals.
         """
-        total_credits = Decimal('0')
-        total_debits = Decimal('0')
-        transaction_count = len(transactions)
+        total_credits = 0.0
+        total_debits = 0.0
         
         for transaction in transactions:
             if transaction.credit:
@@ -76,15 +93,33 @@ class MonthlySummarizer:
             if transaction.debit:
                 total_debits += transaction.debit
         
+        return self._totals_dict(total_credits, total_debits, len(transactions))
+    
+    def _totals_dict(
+        self,
+        total_credits: float,
+        total_debits: float,
+        transaction_count: int
+    ) -> Dict[str, Any]:
+        """Build the monthly totals dictionary from accumulated sums.
+        
+        Args:
+            total_credits: Sum of credit amounts.
+            total_debits: Sum of debit amounts.
+            transaction_count: Number of transactions.
+            
+        Returns:
+            Dictionary with monthly totals.
+        """
         net_amount = total_credits - total_debits
         
         return {
             "transaction_count": transaction_count,
-            "total_credits": float(total_credits),
-            "total_debits": float(total_debits),
-            "net_amount": float(net_amount),
-            "average_credit": float(total_credits / max(transaction_count, 1)),
-            "average_debit": float(total_debits / max(transaction_count, 1)),
+            "total_credits": round(total_credits, 2),
+            "total_debits": round(total_debits, 2),
+            "net_amount": round(net_amount, 2),
+            "average_credit": total_credits / max(transaction_count, 1),
+            "average_debit": total_debits / max(transaction_count, 1),
         }
     
     def calculate_monthly_summary(
@@ -110,27 +145,40 @@ class MonthlySummarizer:
                 "net_amount": 0.0,
             }
         
-        # Basic totals
-        totals = self.calculate_monthly_totals(transactions)
+        # One pass collects everything the totals, daily, top-transaction,
+        # highest-amount and balance analyses need
+        total_credits = 0.0
+        total_debits = 0.0
+        credits = []
+        debits = []
+        active_dates = set()
+        balances = []
+        
+        for transaction in transactions:
+            if transaction.credit:
+                total_credits += transaction.credit
+                credits.append(transaction)
+                active_dates.add(transaction.date)
+            if transaction.debit:
+                total_debits += transaction.debit
+                debits.append(transaction)
+                active_dates.add(transaction.date)
+            if transaction.balance is not None:
+                balances.append(transaction.balance)
         
         # Additional analysis
-        daily_totals = self._calculate_daily_totals(transactions)
-        top_transactions = self._get_top_transactions(transactions)
         category_analysis = self._analyze_transaction_categories(transactions)
         
-        # Balance analysis
-        balance_analysis = self._analyze_balance_changes(transactions)
-        
         summary = {
             "month": month_key,
-            **totals,
-            "daily_average_transactions": len(daily_totals) / max(len(daily_totals), 1),
-            "highest_single_credit": self._get_highest_amount(transactions, "credit"),
-            "highest_single_debit": self._get_highest_amount(transactions, "debit"),
-            "top_credits": top_transactions["credits"][:5],
-            "top_debits": top_transactions["debits"][:5],
+            **self._totals_dict(total_credits, total_debits, len(transactions)),
+            "daily_average_transactions": len(active_dates) / max(len(active_dates), 1),
+            "highest_single_credit": max(float(t.credit) for t in credits) if credits else None,
+            "highest_single_debit": max(float(t.debit) for t in debits) if debits else None,
+            "top_credits": self._amount_dicts(heapq.nlargest(5, credits, key=attrgetter("credit")), "credit"),
+            "top_debits": self._amount_dicts(heapq.nlargest(5, debits, key=attrgetter("debit")), "debit"),
             "category_breakdown": category_analysis,
-            "balance_analysis": balance_analysis,
+            "balance_analysis": self._summarize_balances(balances),
         }
         
         return summary
@@ -138,7 +186,7 @@ class MonthlySummarizer:
     def _calculate_daily_totals(
         self,
         transactions: List[TransactionData]
-    ) -> Dict[str, Dict[str, Decimal]]:
+    ) -> Dict[str, Dict[str, float]]:
         """Calculate daily totals for transactions.
         
         Args:
@@ -147,7 +195,7 @@ class MonthlySummarizer:
         Returns:
             Dictionary with date keys and daily totals.
         """
-        daily_totals = defaultdict(lambda: {"credits": Decimal('0'), "debits": Decimal('0')})
+        daily_totals = defaultdict(lambda: {"credits": 0.0, "debits": 0.0})
         
         for transaction in transactions:
             if transaction.credit:
@@ -177,28 +225,34 @@ class MonthlySummarizer:
         debits.sort(key=lambda x: x.debit, reverse=True)
         
         # Convert to dictionaries for Excel compatibility
-        credit_dicts = [
-            {
-                "date": t.date,
-                "description": t.description,
-                "amount": float(t.credit) if t.credit else 0.0
-            }
-            for t in credits
-        ]
+        return {
+            "credits": self._amount_dicts(credits, "credit"),
+            "debits": self._amount_dicts(debits, "debit"),
+        }
+    
+    def _amount_dicts(
+        self,
+        transactions: List[TransactionData],
+        transaction_type: str
+    ) -> List[Dict[str, Any]]:
+        """Convert transactions to date/description/amount dictionaries.
         
-        debit_dicts = [
-            {
+        Args:
+            transactions: List of transactions.
+            transaction_type: Either "credit" or "debit".
+            
+        Returns:
+            List of dictionaries for Excel compatibility.
+        """
+        dicts = []
+        for t in transactions:
+            amount = getattr(t, transaction_type)
+            dicts.append({
                 "date": t.date,
                 "description": t.description,
-                "amount": float(t.debit) if t.debit else 0.0
-            }
-            for t in debits
-        ]
-        
-        return {
-            "credits": credit_dicts,
-            "debits": debit_dicts,
-        }
+                "amount": float(amount) if amount else 0.0
+            })
+        return dicts
     
     def _analyze_transaction_categories(
         self,
@@ -212,7 +266,7 @@ class MonthlySummarizer:
         Returns:
             Dictionary with category analysis.
         """
-        categories = defaultdict(lambda: {"count": 0, "total": Decimal('0'), "type": "unknown"})
+        categories = defaultdict(lambda: {"count": 0, "total": 0.0, "type": "unknown"})
         
         # Simple category keywords
         category_keywords = {
@@ -251,7 +305,7 @@ class MonthlySummarizer:
         for category, data in categories.items():
             result[category] = {
                 "count": data["count"],
-                "total": float(data["total"]),
+                "total": round(data["total"], 2),
                 "percentage": (data["count"] / total_transactions) * 100 if total_transactions > 0 else 0,
                 "type": data["type"],
             }
@@ -271,7 +325,17 @@ class MonthlySummarizer:
             Dictionary with balance analysis.
         """
         balances = [t.balance for t in transactions if t.balance is not None]
+        return self._summarize_balances(balances)
+    
+    def _summarize_balances(self, balances: List[float]) -> Dict[str, Any]:
+        """Summarize a month's running balances in transaction order.
         
+        Args:
+            balances: Non-null balances of the month's transactions.
+            
+        Returns:
+            Dictionary with balance analysis.
+        """
         if not balances:
             return {
                 "opening_balance": None,
@@ -347,15 +411,15 @@ class MonthlySummarizer:
         
         # Calculate monthly summaries
         monthly_summaries = {}
-        overall_credits = Decimal('0')
-        overall_debits = Decimal('0')
+        overall_credits = 0.0
+        overall_debits = 0.0
         
         for month_key, month_transactions in monthly_groups.items():
             summary = self.calculate_monthly_summary(month_key, month_transactions)
             monthly_summaries[month_key] = summary
             
-            overall_credits += Decimal(str(summary["total_credits"]))
-            overall_debits += Decimal(str(summary["total_debits"]))
+            overall_credits += summary["total_credits"]
+            overall_debits += summary["total_debits"]
         
         # Calculate overall totals
         overall_net = overall_credits - overall_debits
@@ -373,9 +437,9 @@ class MonthlySummarizer:
             "total_transactions": len(transactions),
             "monthly_summaries": monthly_summaries,
             "overall_totals": {
-                "total_credits": float(overall_credits),
-                "total_debits": float(overall_debits),
-                "net_amount": float(overall_net),
+                "total_credits": round(overall_credits, 2),
+                "total_debits": round(overall_debits, 2),
+                "net_amount": round(overall_net, 2),
             },
             "analysis_period": analysis_period,
             "average_monthly_transactions": len(transactions) / max(len(monthly_groups), 1),
@@ -3,10 +3,14 @@
 import os
 import sys
 import time
+import shutil
+import struct
+import functools
 import psutil
 import platform
+import importlib.metadata
 import redis
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 import subprocess
 from datetime import datetime, timedelta
@@ -15,6 +19,47 @@ from src.config.settings import Settings
 from src.utils.logger import get_logger
 
 
+# Critical dependencies (display name -> distribution name)
+DEPENDENCIES = {
+    'PyPDF2': 'PyPDF2',
+    'pdfplumber': 'pdfplumber',
+    'pandas': 'pandas',
+    'openpyxl': 'openpyxl',
+    'celery': 'celery',
+    'redis': 'redis',
+    'psutil': 'psutil',
+}
+
+
+def _snapshot_dependencies() -> Tuple[Dict[str, str], List[str]]:
+    """Read installed dependency versions from distribution metadata."""
+    versions = {}
+    missing = []
+    for name, package in DEPENDENCIES.items():
+        try:
+            versions[name] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            missing.append(name)
+    return versions, missing
+
+
+# Installed packages cannot change for the lifetime of the process
+DEPENDENCY_VERSIONS, MISSING_DEPS = _snapshot_dependencies()
+
+
+@functools.lru_cache(maxsize=1)
+def _read_cpu_model() -> str:
+    """Read the CPU model name from /proc/cpuinfo (Linux only)."""
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor()
+
+
 class HealthChecker:
     """Health checker for monitoring system components."""
     
@@ -23,6 +68,9 @@ class HealthChecker:
         self.settings = settings
         self.logger = get_logger(self.__class__.__name__)
         
+        # (sampled_at, load_average) - the kernel only refreshes it every 5s
+        self._loadavg_cache: Optional[Tuple[float, Optional[Tuple[float, ...]]]] = None
+        
         # Component checkers
         self.components = {
             'system': self._check_system_health,
@@ -35,12 +83,18 @@ class HealthChecker:
             'environment': self._check_environment,
         }
     
-    def run_health_check(self) -> Dict[str, Any]:
-        """Run comprehensive health check."""
+    def run_health_check(self, fail_fast: bool = False) -> Dict[str, Any]:
+        """Run comprehensive health check.
+        
+        Args:
+            fail_fast: Stop at the first component that is not healthy and
+                report the system as unhealthy without running the rest.
+        """
         start_time = time.time()
+        ts = datetime.now().isoformat()
         health_data = {
             'status': 'healthy',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': ts,
             'uptime': self._get_uptime(),
             'version': self._get_version(),
             'components': {},
@@ -53,7 +107,7 @@ class HealthChecker:
         # Check all components
         for component_name, check_func in self.components.items():
             try:
-                result = check_func()
+                result = check_func(ts)
                 health_data['components'][component_name] = result
                 
                 if result['status'] != 'healthy':
@@ -67,17 +121,23 @@ class HealthChecker:
                 health_data['components'][component_name] = {
                     'status': 'error',
                     'message': str(e),
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': ts,
                 }
                 component_issues.append(component_name)
+            
+            if fail_fast and component_issues:
+                return self._fail_fast_result(health_data, start_time)
         
         # Check task processing health
-        task_health = self._check_task_health()
+        task_health = self._check_task_health(ts)
         health_data['components']['tasks'] = task_health
         
         if task_health['status'] != 'healthy':
             component_issues.append('tasks')
             health_data['alerts'].append(f"Task processing: {task_health.get('message', 'Issues detected')}")
+            
+            if fail_fast:
+                return self._fail_fast_result(health_data, start_time)
         
         # Collect performance metrics
         health_data['metrics'] = self._collect_metrics()
@@ -94,31 +154,48 @@ class HealthChecker:
         
         return health_data
     
-    def _check_system_health(self) -> Dict[str, Any]:
+    def _fail_fast_result(self, health_data: Dict[str, Any], start_time: float) -> Dict[str, Any]:
+        """Finalize a health check that stopped at the first failing component."""
+        health_data['status'] = 'unhealthy'
+        health_data['check_duration'] = round(time.time() - start_time, 3)
+        return health_data
+    
+    def _check_system_health(self, ts: Optional[str] = None) -> Dict[str, Any]:
         """Check basic system health."""
+        ts = ts or datetime.now().isoformat()
         try:
-            system_info = {
-                'platform': platform.platform(),
-                'python_version': sys.version,
-                'architecture': platform.architecture(),
-                'processor': platform.processor(),
-            }
+            if sys.platform.startswith('linux'):
+                # Avoid platform's subprocess/file probing on Linux
+                system_info = {
+                    'platform': f"{sys.platform} {os.uname().release}",
+                    'python_version': sys.version,
+                    'architecture': (f"{struct.calcsize('P') * 8}bit", ''),
+                    'processor': _read_cpu_model(),
+                }
+            else:
+                system_info = {
+                    'platform': platform.platform(),
+                    'python_version': sys.version,
+                    'architecture': platform.architecture(),
+                    'processor': platform.processor(),
+                }
             
             return {
                 'status': 'healthy',
                 'info': system_info,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': ts,
             }
             
         except Exception as e:
             return {
                 'status': 'error',
                 'message': f"System check failed: {e}",
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': ts,
             }
     
-    def _check_redis_health(self) -> Dict[str, Any]:
+    def _check_redis_health(self, ts: Optional[str] = None) -> Dict[str, Any]:
         """Check Redis connectivity and health."""
+        ts = ts or datetime.now().isoformat()
         try:
             # Test Redis connection
             client = redis.Redis(
@@ -143,26 +220,31 @@ class HealthChecker:
                     'used_memory': info.get('used_memory_human'),
                     'uptime_in_seconds': info.get('uptime_in_seconds'),
                 },
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': ts,
             }
             
         except redis.ConnectionError:
             return {
                 'status': 'unhealthy',
                 'message': 'Cannot connect to Redis',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': ts,
             }
         except Exception as e:
             return {
                 'status': 'error',
                 'message': f"Redis check failed: {e}",
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': ts,
             }
     
-    def _check_disk_space(self) -> Dict[str, Any]:
+    def _check_disk_space(self, ts: Optional[str] = None) -> Dict[str, Any]:
         """Check disk space availability."""
+        ts = ts or datetime.now().isoformat()
         try:
-            disk_usage = psutil.disk_usage('/')
+            # Measure the filesystem reports are written to, not just '/'
+            disk_path = self.settings.output_dir or '/'
+            if not os.path.isdir(disk_path):
+                disk_path = '/'
+            disk_usage = shutil.disk_usage(disk_path)
             free_gb = disk_usage.free / (1024**3)
             total_gb = disk_usage.total / (1024**3)
             used_percent = (disk_usage.used / disk_usage.total) * 100
@@ -176,25 +258,26 @@ class HealthChecker:
             return {
                 'status': status,
                 'info': {
+                    'path': disk_path,
                     'total_gb': round(total_gb, 2),
                     'free_gb': round(free_gb, 2),
                     'used_percent': round(used_percent, 2),
                 },
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': ts,
             }
             
         except Exception as e:
             return {
                 'status': 'error',
                 'message': f"Disk space check failed: {e}",
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': ts,
             }
     
-    def _check_memory_usage(self) -> Dict[str, Any]:
+    def _check_memory_usage(self, ts: Optional[str] = None) -> Dict[str, Any]:
         """Check memory usage."""
+        ts = ts or datetime.now().isoformat()
         try:
             memory = psutil.virtual_memory()
-            swap = psutil.swap_memory()
             
             status = 'healthy'
             if memory.percent > 90:
@@ -208,26 +291,25 @@ class HealthChecker:
                     'total_gb': round(memory.total / (1024**3), 2),
                     'available_gb': round(memory.available / (1024**3), 2),
                     'used_percent': round(memory.percent, 2),
-                    'swap_total_gb': round(swap.total / (1024**3), 2),
-                    'swap_used_percent': round(swap.percent, 2),
                 },
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': ts,
             }
             
         except Exception as e:
             return {
                 'status': 'error',
                 'message': f"Memory check failed: {e}",
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': ts,
             }
     
-    def _check_cpu_usage(self) -> Dict[str, Any]:
+    def _check_cpu_usage(self, ts: Optional[str] = None) -> Dict[str, Any]:
         """Check CPU usage."""
+        ts = ts or datetime.now().isoformat()
         try:
             # Get CPU usage over 1 second
             cpu_percent = psutil.cpu_percent(interval=1)
             cpu_count = psutil.cpu_count()
-            load_avg = os.getloadavg() if hasattr(os, 'getloadavg') else None
+            load_avg = self._get_load_average()
             
             status = 'healthy'
             if cpu_percent > 90:
@@ -242,55 +324,51 @@ class HealthChecker:
                     'count': cpu_count,
                     'load_average': load_avg,
                 },
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': ts,
             }
             
         except Exception as e:
             return {
                 'status': 'error',
                 'message': f"CPU check failed: {e}",
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': ts,
             }
     
-    def _check_dependencies(self) -> Dict[str, Any]:
-        """Check critical dependencies."""
-        dependencies = {
-            'PyPDF2': 'PyPDF2',
-            'pdfplumber': 'pdfplumber',
-            'pandas': 'pandas',
-            'openpyxl': 'openpyxl',
-            'celery': 'celery',
-            'redis': 'redis',
-            'psutil': 'psutil',
-        }
-        
-        missing_deps = []
-        version_info = {}
+    def _get_load_average(self) -> Optional[Tuple[float, ...]]:
+        """Get the 1/5/15 minute load average, cached for 5 seconds."""
+        now = time.monotonic()
+        if self._loadavg_cache is not None and now - self._loadavg_cache[0] < 5.0:
+            return self._loadavg_cache[1]
         
-        for name, package in dependencies.items():
-            try:
-                module = __import__(package)
-                version = getattr(module, '__version__', 'unknown')
-                version_info[name] = version
-            except ImportError:
-                missing_deps.append(name)
+        try:
+            with open('/proc/loadavg', 'rb') as f:
+                load_avg = tuple(float(value) for value in f.read().split()[:3])
+        except OSError:
+            load_avg = os.getloadavg() if hasattr(os, 'getloadavg') else None
         
+        self._loadavg_cache = (now, load_avg)
+        return load_avg
+    
+    def _check_dependencies(self, ts: Optional[str] = None) -> Dict[str, Any]:
+        """Check critical dependencies."""
+        ts = ts or datetime.now().isoformat()
         status = 'healthy'
-        if missing_deps:
+        if MISSING_DEPS:
             status = 'unhealthy'
         
         return {
             'status': status,
             'info': {
-                'available': list(version_info.keys()),
-                'missing': missing_deps,
-                'versions': version_info,
+                'available': list(DEPENDENCY_VERSIONS.keys()),
+                'missing': list(MISSING_DEPS),
+                'versions': dict(DEPENDENCY_VERSIONS),
             },
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': ts,
         }
     
-    def _check_file_permissions(self) -> Dict[str, Any]:
+    def _check_file_permissions(self, ts: Optional[str] = None) -> Dict[str, Any]:
         """Check file permissions for critical directories."""
+        ts = ts or datetime.now().isoformat()
         critical_paths = [
             self.settings.output_dir,
             'logs',
@@ -331,11 +409,12 @@ class HealthChecker:
                 'paths': path_status,
                 'issues': permission_issues,
             },
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': ts,
         }
     
-    def _check_environment(self) -> Dict[str, Any]:
+    def _check_environment(self, ts: Optional[str] = None) -> Dict[str, Any]:
         """Check environment configuration."""
+        ts = ts or datetime.now().isoformat()
         required_vars = [
             'PDF_PASSWORD',
             'CURRENCY_SYMBOL',
@@ -370,11 +449,12 @@ class HealthChecker:
                 'environment_variables': env_vars,
                 'missing_required': missing_required,
             },
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': ts,
         }
     
-    def _check_task_health(self) -> Dict[str, Any]:
+    def _check_task_health(self, ts: Optional[str] = None) -> Dict[str, Any]:
         """Check Celery task processing health."""
+        ts = ts or datetime.now().isoformat()
         try:
             from src.tasks.celery_app import create_celery_app
             
@@ -385,7 +465,7 @@ class HealthChecker:
                 return {
                     'status': 'unhealthy',
                     'message': 'Cannot create Celery app',
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': ts,
                 }
             
             # Check worker status
@@ -399,27 +479,37 @@ class HealthChecker:
                     'active_tasks': sum(len(tasks) for tasks in (active_tasks or {}).values()),
                     'reserved_tasks': sum(len(tasks) for tasks in (reserved_tasks or {}).values()),
                 },
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': ts,
             }
             
         except Exception as e:
             return {
                 'status': 'error',
                 'message': f"Task health check failed: {e}",
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': ts,
             }
     
-    def _collect_metrics(self) -> Dict[str, Any]:
-        """Collect performance metrics."""
+    def _collect_metrics(self, detailed: bool = False) -> Dict[str, Any]:
+        """Collect performance metrics.
+        
+        Swap usage is only collected when ``detailed`` is set, as it needs
+        extra /proc reads that the routine probe path does not use.
+        """
         try:
             process = psutil.Process()
             
-            return {
+            # Count descriptors without the per-fd readlink open_files() does
+            try:
+                open_files = len(os.listdir('/proc/self/fd'))
+            except OSError:
+                open_files = len(process.open_files())
+            
+            metrics = {
                 'process': {
                     'cpu_percent': process.cpu_percent(),
                     'memory_mb': round(process.memory_info().rss / (1024**2), 2),
                     'memory_percent': process.memory_percent(),
-                    'open_files': len(process.open_files()),
+                    'open_files': open_files,
                     'threads': process.num_threads(),
                 },
                 'system': {
@@ -428,6 +518,13 @@ class HealthChecker:
                 },
             }
             
+            if detailed:
+                swap = psutil.swap_memory()
+                metrics['system']['swap_total_gb'] = round(swap.total / (1024**3), 2)
+                metrics['system']['swap_used_percent'] = round(swap.percent, 2)
+            
+            return metrics
+            
         except Exception as e:
             return {
                 'error': f"Metrics collection failed: {e}",
@@ -468,7 +565,7 @@ class HealthChecker:
     
     def is_healthy(self) -> bool:
         """Quick health check - returns True if system is healthy."""
-        health_data = self.run_health_check()
+        health_data = self.run_health_check(fail_fast=True)
         return health_data['status'] == 'healthy'
     
     def get_health_summary(self) -> str:
@@ -506,7 +603,7 @@ class MonitoringEndpoint:
     
     def metrics(self) -> Dict[str, Any]:
         """Return JSON metrics response."""
-        return self.health_checker._collect_metrics()
+        return self.health_checker._collect_metrics(detailed=True)
     
     def ready(self) -> Dict[str, Any]:
         """Kubernetes readiness probe equivalent."""
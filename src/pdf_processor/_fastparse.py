@@ -0,0 +1,176 @@
+"""Type-annotated string parsers for the extraction hot path.
+
+The module is plain Python, but it is written so mypyc can compile it:
+setting PDF_PROCESSOR_MYPYC=1 when installing builds it as a C extension,
+which is then imported in place of this file.
+"""
+
+import re
+from datetime import date
+from typing import Dict, List, Optional, Pattern
+
+# Characters stripped from amount strings (currency symbols, whitespace, etc.)
+_CURRENCY_RE: Pattern[str] = re.compile(r'[^\d.,-]')
+
+# Translation tables for the plain-number fast path in parse_amount
+_AMOUNT_CHARS_TABLE: Dict[int, Optional[int]] = str.maketrans('', '', '0123456789.,-')
+_THOUSANDS_SEP_TABLE: Dict[int, Optional[int]] = str.maketrans('', '', ',')
+
+# Date patterns, in the order parse_date tries them
+DATE_PATTERN_STRINGS: List[str] = [
+    r'\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})\b',  # DD/MM/YYYY or DD-MM-YYYY
+    r'\b(\d{4}[/-]\d{1,2}[/-]\d{1,2})\b',  # YYYY/MM/DD or YYYY-MM-DD
+    r'\b(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{2,4})\b',  # DD Mon YYYY
+]
+DATE_PATTERNS: List[Pattern[str]] = [re.compile(p, re.IGNORECASE) for p in DATE_PATTERN_STRINGS]
+
+# Abbreviated month names, replacing datetime.strptime(month, '%b')
+MONTHS: Dict[str, int] = {
+    'JAN': 1, 'FEB': 2, 'MAR': 3, 'APR': 4, 'MAY': 5, 'JUN': 6,
+    'JUL': 7, 'AUG': 8, 'SEP': 9, 'OCT': 10, 'NOV': 11, 'DEC': 12,
+}
+
+
+def parse_amount(amount_str: str) -> Optional[float]:
+    """Parse amount string to float.
+    
+    Args:
+        amount_str: String containing amount.
+        
+    Returns:
+        Parsed amount or None if parsing fails.
+    """
+    try:
+        if not amount_str:
+            return None
+        
+        amount_str = amount_str.strip()
+        if amount_str in ('', '-', '0.00', '0'):
+            return None
+        
+        # Fast path: plain numbers such as "1,234.56" need no regex cleanup
+        if (not amount_str.translate(_AMOUNT_CHARS_TABLE)
+                and ('.' in amount_str or ',' not in amount_str)):
+            return float(amount_str.translate(_THOUSANDS_SEP_TABLE))
+            
+        # Remove currency symbols and whitespace, but keep negative sign
+        clean_amount = _CURRENCY_RE.sub('', amount_str)
+        
+        if not clean_amount:
+            return None
+        
+        # Handle different decimal separators
+        if ',' in clean_amount and '.' in clean_amount:
+            # If both exist, assume comma is thousands separator
+            clean_amount = clean_amount.replace(',', '')
+        elif ',' in clean_amount:
+            # Check if comma is decimal separator (last occurrence)
+            last_comma = clean_amount.rfind(',')
+            if len(clean_amount) - last_comma - 1 <= 2:
+                # Likely decimal separator
+                clean_amount = clean_amount.replace(',', '.')
+            else:
+                # Likely thousands separator
+                clean_amount = clean_amount.replace(',', '')
+        
+        return float(clean_amount)
+        
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_fixed_width_date(date_str: str) -> Optional[str]:
+    """Parse a bare 10-character YYYY-MM-DD or DD/MM/YYYY date by slicing.
+    
+    Args:
+        date_str: String containing date.
+        
+    Returns:
+        Standardized date string (YYYY-MM-DD), or None if the string is not
+        exactly one valid date in either layout.
+    """
+    if len(date_str) != 10:
+        return None
+    
+    if date_str[4] in '-/' and date_str[7] in '-/':
+        year, month, day = date_str[:4], date_str[5:7], date_str[8:]
+    elif date_str[2] in '-/' and date_str[5] in '-/':
+        year, month, day = date_str[6:], date_str[3:5], date_str[:2]
+    else:
+        return None
+    
+    if not (year.isdecimal() and month.isdecimal() and day.isdecimal()):
+        return None
+    
+    try:
+        date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+    return f"{year}-{month}-{day}"
+
+
+def parse_date(date_str: str) -> Optional[str]:
+    """Parse a date string to YYYY-MM-DD.
+    
+    Args:
+        date_str: String containing date.
+        
+    Returns:
+        Standardized date string (YYYY-MM-DD) or None if parsing fails.
+    """
+    try:
+        # Fast path: table date cells are usually one bare numeric date
+        parsed = _parse_fixed_width_date(date_str)
+        if parsed is not None:
+            return parsed
+        
+        # Try different date patterns
+        for pattern in DATE_PATTERNS:
+            match = pattern.search(date_str)
+            if match:
+                date_value = match.group(1)
+                # Normalize date format
+                date_value = date_value.replace('/', '-').replace(' ', '-')
+                
+                # Handle different formats
+                parts = date_value.split('-')
+                if len(parts) == 3:
+                    # Try to determine format
+                    if len(parts[0]) == 4:  # YYYY-MM-DD
+                        year = parts[0]
+                        month = parts[1]
+                        day = parts[2]
+                    elif len(parts[2]) == 4:  # DD-MM-YYYY
+                        year = parts[2]
+                        month = parts[1]
+                        day = parts[0]
+                    elif len(parts[2]) == 2:  # DD-MM-YY
+                        year = f"20{parts[2]}" if int(parts[2]) < 50 else f"19{parts[2]}"
+                        month = parts[1]
+                        day = parts[0]
+                    else:
+                        continue
+                    
+                    # Handle month names (Nov, Jan, etc.)
+                    if not month.isdigit():
+                        # Convert month name to number
+                        month_num = MONTHS.get(month.upper())
+                        if month_num is None:
+                            continue
+                        month = f"{month_num:02d}"
+                    else:
+                        month = month.zfill(2)
+                    
+                    day = day.zfill(2)
+                    
+                    # Validate the date
+                    try:
+                        date(int(year), int(month), int(day))
+                        return f"{year}-{month}-{day}"
+                    except ValueError:
+                        continue
+        
+        return None
+        
+    except Exception:
+        return None
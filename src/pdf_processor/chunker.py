@@ -7,6 +7,11 @@ from typing import Generator, List, Optional
 import PyPDF2
 from PyPDF2 import PdfReader, PdfWriter
 
+try:
+    import pikepdf
+except ImportError:  # pragma: no cover - optional QPDF-backed chunking
+    pikepdf = None
+
 from src.config.settings import MAX_CHUNK_SIZE_MB, MAX_PAGES_PER_CHUNK
 from src.utils.logger import get_logger
 from src.utils.validators import ValidationError, validate_page_range
@@ -20,9 +25,25 @@ class PDFChunkingError(Exception):
 class PDFChunker:
     """Handles PDF chunking operations for large files."""
     
-    def __init__(self) -> None:
-        """Initialize PDF chunker."""
+    SUPPORTED_BACKENDS = ("pypdf2", "pikepdf")
+    
+    def __init__(self, backend: str = "pypdf2") -> None:
+        """Initialize PDF chunker.
+        
+        Args:
+            backend: Chunk writer backend, "pypdf2" or "pikepdf". Falls back
+                to "pypdf2" when pikepdf is not installed.
+        """
         self.logger = get_logger(__name__)
+        
+        if backend not in self.SUPPORTED_BACKENDS:
+            raise PDFChunkingError(f"Unsupported chunking backend: {backend}")
+        
+        if backend == "pikepdf" and pikepdf is None:
+            self.logger.warning("pikepdf is not installed, falling back to PyPDF2 chunking")
+            backend = "pypdf2"
+        
+        self.backend = backend
     
     def get_pdf_size_mb(self, pdf_path: str) -> float:
         """Get PDF file size in MB.
@@ -88,7 +109,8 @@ class PDFChunker:
         reader: PdfReader,
         start_page: int,
         end_page: int,
-        output_path: Optional[str] = None
+        output_path: Optional[str] = None,
+        page_objs: Optional[List] = None
     ) -> str:
         """Create a PDF chunk containing specified pages.
         
@@ -97,6 +119,8 @@ class PDFChunker:
             start_page: Starting page number (1-based).
             end_page: Ending page number (1-based).
             output_path: Optional output path for chunk file.
+            page_objs: Optional pre-materialized ``list(reader.pages)``, so
+                callers creating several chunks resolve the page tree once.
             
         Returns:
             Path to created chunk file.
@@ -105,21 +129,19 @@ class PDFChunker:
             PDFChunkingError: If chunk creation fails.
         """
         try:
-            validate_page_range(start_page, end_page, len(reader.pages))
+            if page_objs is None:
+                page_objs = list(reader.pages)
+            validate_page_range(start_page, end_page, total_pages=len(page_objs))
             
             writer = PdfWriter()
             
             # Add pages to chunk (convert to 0-based index)
-            for page_num in range(start_page - 1, end_page):
-                writer.add_page(reader.pages[page_num])
+            for page in page_objs[start_page - 1:end_page]:
+                writer.add_page(page)
             
             # Determine output path
             if output_path is None:
-                temp_dir = tempfile.gettempdir()
-                output_path = os.path.join(
-                    temp_dir,
-                    f"pdf_chunk_{start_page}_{end_page}.pdf"
-                )
+                output_path = self._get_chunk_path(start_page, end_page)
             
             # Write chunk to file
             with open(output_path, 'wb') as output_file:
@@ -133,12 +155,82 @@ class PDFChunker:
         except Exception as e:
             raise PDFChunkingError(f"Failed to create chunk: {str(e)}")
     
+    def create_chunk_from_file(
+        self,
+        pdf_path: str,
+        start_page: int,
+        end_page: int,
+        output_path: Optional[str] = None,
+        password: Optional[str] = None
+    ) -> str:
+        """Create a PDF chunk directly from a file using the configured backend.
+        
+        With the pikepdf backend the pages are copied and serialized by QPDF;
+        otherwise the file is opened with PyPDF2 and passed to create_chunk.
+        
+        Args:
+            pdf_path: Path to the source PDF file.
+            start_page: Starting page number (1-based).
+            end_page: Ending page number (1-based).
+            output_path: Optional output path for chunk file.
+            password: Optional password for encrypted PDFs.
+            
+        Returns:
+            Path to created chunk file.
+            
+        Raises:
+            PDFChunkingError: If chunk creation fails.
+        """
+        if self.backend != "pikepdf":
+            try:
+                reader = PdfReader(pdf_path)
+                if reader.is_encrypted and password:
+                    reader.decrypt(password)
+            except Exception as e:
+                raise PDFChunkingError(f"Failed to open PDF for chunking: {str(e)}")
+            return self.create_chunk(reader, start_page, end_page, output_path)
+        
+        try:
+            with pikepdf.open(pdf_path, password=password or "") as src:
+                validate_page_range(start_page, end_page, total_pages=len(src.pages))
+                
+                if output_path is None:
+                    output_path = self._get_chunk_path(start_page, end_page)
+                
+                dst = pikepdf.Pdf.new()
+                dst.pages.extend(src.pages[start_page - 1:end_page])
+                dst.save(output_path, linearize=False, compress_streams=False)
+            
+            self.logger.debug(f"Created chunk with pikepdf: pages {start_page}-{end_page}")
+            return output_path
+            
+        except ValidationError as e:
+            raise PDFChunkingError(f"Invalid page range: {str(e)}")
+        except Exception as e:
+            raise PDFChunkingError(f"Failed to create chunk: {str(e)}")
+    
+    def _get_chunk_path(self, start_page: int, end_page: int) -> str:
+        """Get the default temporary path for a chunk file.
+        
+        Args:
+            start_page: Starting page number (1-based).
+            end_page: Ending page number (1-based).
+            
+        Returns:
+            Path to the chunk file in the system temp directory.
+        """
+        return os.path.join(
+            tempfile.gettempdir(),
+            f"pdf_chunk_{start_page}_{end_page}.pdf"
+        )
+    
     def generate_chunks(
         self,
         pdf_path: str,
         reader: PdfReader,
         chunk_ranges: Optional[List[tuple]] = None,
-        cleanup: bool = True
+        cleanup: bool = True,
+        password: Optional[str] = None
     ) -> Generator[str, None, None]:
         """Generate PDF chunks for processing.
         
@@ -147,6 +239,7 @@ class PDFChunker:
             reader: PdfReader object.
             chunk_ranges: Optional list of (start_page, end_page) tuples.
             cleanup: Whether to cleanup temporary files after use.
+            password: Optional password, used by the pikepdf backend.
             
         Yields:
             Paths to chunk files.
@@ -157,6 +250,10 @@ class PDFChunker:
         temp_files = []
         
         try:
+            # Resolved once per call and dropped with the generator, so a
+            # long-lived chunker never pins a finished statement's pages
+            page_objs = list(reader.pages) if self.backend != "pikepdf" else None
+            
             if chunk_ranges is None:
                 file_size_mb = self.get_pdf_size_mb(pdf_path)
                 chunk_ranges = self.calculate_optimal_chunks(
@@ -164,7 +261,14 @@ class PDFChunker:
                 )
             
             for start_page, end_page in chunk_ranges:
-                chunk_path = self.create_chunk(reader, start_page, end_page)
+                if self.backend == "pikepdf":
+                    chunk_path = self.create_chunk_from_file(
+                        pdf_path, start_page, end_page, password=password
+                    )
+                else:
+                    chunk_path = self.create_chunk(
+                        reader, start_page, end_page, page_objs=page_objs
+                    )
                 temp_files.append(chunk_path)
                 yield chunk_path
             
@@ -1,21 +1,78 @@
 """PDF decryption utilities for processing encrypted bank statements."""
 
+import io
 import os
-from typing import Optional
+import functools
+from typing import BinaryIO, List, Optional, Sequence, Tuple, Union
 
-import PyPDF2
 from PyPDF2 import PdfReader
+from PyPDF2.errors import PdfReadError
+
+try:
+    import pikepdf
+except ImportError:  # pragma: no cover - optional QPDF-backed decryption
+    pikepdf = None
 
 from src.config.settings import DEFAULT_PASSWORD_FILE
 from src.utils.logger import get_logger
 from src.utils.validators import ValidationError, validate_password
 
+# Buffer size for file handles, so PyPDF2's many small xref reads hit memory
+_READ_BUFFER_SIZE = 1 << 20
+
 
 class PDFDecryptionError(Exception):
     """Custom exception for PDF decryption errors."""
     pass
 
 
+def _open_pdf_stream(pdf_path: str) -> BinaryIO:
+    """Open a PDF as a random-access stream suited to PyPDF2.
+    
+    The file is loaded into a BytesIO in one read and its handle closed, so
+    a PdfReader built on the stream stays usable after the caller returns
+    without keeping a file descriptor open. Uploads are capped by
+    MAX_FILE_SIZE_MB, which bounds the memory this takes.
+    
+    Args:
+        pdf_path: Path to PDF file.
+        
+    Returns:
+        Binary stream positioned at the start of the file.
+    """
+    with open(pdf_path, 'rb') as file:
+        return io.BytesIO(file.read())
+
+
+@functools.lru_cache(maxsize=8)
+def _read_password_file(password_file: str, mtime_ns: int, size: int) -> str:
+    """Read and parse a password file.
+    
+    Cached on the file's modification time and size, so repeated lookups
+    skip the file I/O until the file changes.
+    
+    Args:
+        password_file: Path to password file.
+        mtime_ns: File modification time in nanoseconds (cache key).
+        size: File size in bytes (cache key).
+        
+    Returns:
+        Validated password string.
+    """
+    with open(password_file, 'r', encoding='utf-8') as f:
+        password_line = f.readline().strip()
+        
+    # Extract password from format like "password-\"110281\""
+    if password_line.startswith('password-'):
+        password = password_line[9:]  # Remove "password-" prefix
+        password = password.strip('"')  # Remove quotes
+    else:
+        password = password_line
+    
+    validate_password(password)
+    return password
+
+
 class PDFDecryptor:
     """Handles PDF decryption operations."""
     
@@ -36,20 +93,12 @@ class PDFDecryptor:
             PDFDecryptionError: If password cannot be loaded.
         """
         try:
-            if not os.path.exists(password_file):
+            try:
+                stat = os.stat(password_file)
+            except FileNotFoundError:
                 raise PDFDecryptionError(f"Password file not found: {password_file}")
             
-            with open(password_file, 'r', encoding='utf-8') as f:
-                password_line = f.readline().strip()
-                
-            # Extract password from format like "password-\"110281\""
-            if password_line.startswith('password-'):
-                password = password_line[9:]  # Remove "password-" prefix
-                password = password.strip('"')  # Remove quotes
-            else:
-                password = password_line
-            
-            validate_password(password)
+            password = _read_password_file(password_file, stat.st_mtime_ns, stat.st_size)
             self.logger.info(f"Loaded default password from {password_file}")
             return password
             
@@ -69,7 +118,7 @@ class PDFDecryptor:
             PDFDecryptionError: If PDF cannot be read.
         """
         try:
-            with open(pdf_path, 'rb') as file:
+            with open(pdf_path, 'rb', buffering=_READ_BUFFER_SIZE) as file:
                 reader = PdfReader(file)
                 return reader.is_encrypted
                 
@@ -79,14 +128,14 @@ class PDFDecryptor:
     def decrypt_pdf(
         self,
         pdf_path: str,
-        password: Optional[str] = None,
+        password: Union[str, Sequence[str], None] = None,
         use_default: bool = True
     ) -> PdfReader:
         """Decrypt PDF file and return reader object.
         
         Args:
             pdf_path: Path to encrypted PDF file.
-            password: Optional password to try.
+            password: Optional password, or list of candidate passwords, to try.
             use_default: Whether to try default password if provided one fails.
             
         Returns:
@@ -96,42 +145,178 @@ class PDFDecryptor:
             PDFDecryptionError: If decryption fails.
         """
         try:
-            with open(pdf_path, 'rb') as file:
-                reader = PdfReader(file)
-                
-                if not reader.is_encrypted:
-                    self.logger.info(f"PDF {pdf_path} is not encrypted")
+            reader = PdfReader(_open_pdf_stream(pdf_path))
+            
+            if not reader.is_encrypted:
+                self.logger.info(f"PDF {pdf_path} is not encrypted")
+                return reader
+            
+            passwords_to_try = self._get_passwords_to_try(password, use_default)
+            
+            # Each failed PyPDF2 attempt re-derives the key in pure Python; with
+            # several candidates, find the right one with qpdf first
+            if pikepdf is not None and len(passwords_to_try) > 1:
+                found = self._find_password_with_pikepdf(pdf_path, passwords_to_try)
+                passwords_to_try = [found] if found is not None else []
+            
+            # Try each password
+            for pwd in passwords_to_try:
+                if reader.decrypt(pwd):
+                    self.logger.info(f"Successfully decrypted PDF with password")
                     return reader
-                
-                passwords_to_try = []
-                
-                if password:
-                    passwords_to_try.append(password)
-                
-                if use_default:
-                    try:
-                        default_password = self.load_default_password()
-                        if default_password not in passwords_to_try:
-                            passwords_to_try.append(default_password)
-                    except PDFDecryptionError:
-                        self.logger.warning("Could not load default password")
-                
-                # Try each password
-                for pwd in passwords_to_try:
-                    if reader.decrypt(pwd):
-                        self.logger.info(f"Successfully decrypted PDF with password")
-                        return reader
-                
-                # If no password worked, raise error
-                raise PDFDecryptionError(
-                    "Failed to decrypt PDF with provided passwords"
-                )
-                
-        except PyPDF2.PdfReadError as e:
+            
+            # If no password worked, raise error
+            raise PDFDecryptionError(
+                "Failed to decrypt PDF with provided passwords"
+            )
+            
+        except PDFDecryptionError:
+            raise
+        except PdfReadError as e:
+            raise PDFDecryptionError(f"PDF read error: {str(e)}")
+        except Exception as e:
+            raise PDFDecryptionError(f"Unexpected error during decryption: {str(e)}")
+    
+    def decrypt_to_bytes(
+        self,
+        pdf_path: str,
+        password: Union[str, Sequence[str], None] = None,
+        use_default: bool = True
+    ) -> Tuple[bytes, Optional[str]]:
+        """Read a PDF once and return bytes that any PDF library can open.
+        
+        With pikepdf installed the document is decrypted by QPDF and the
+        returned bytes are an unencrypted copy, so downstream readers such as
+        pdfplumber skip their own pure-Python decryption. Without pikepdf the
+        original bytes are returned together with the password that opened
+        them.
+        
+        Args:
+            pdf_path: Path to PDF file.
+            password: Optional password, or list of candidate passwords, to try.
+            use_default: Whether to try default password if provided one fails.
+            
+        Returns:
+            Tuple of (PDF bytes, password still needed to open them or None).
+            
+        Raises:
+            PDFDecryptionError: If decryption fails.
+        """
+        try:
+            with open(pdf_path, 'rb') as file:
+                data = file.read()
+            
+            if pikepdf is not None:
+                return self._decrypt_bytes_with_pikepdf(data, password, use_default), None
+            
+            reader = PdfReader(io.BytesIO(data))
+            if not reader.is_encrypted:
+                return data, None
+            
+            for pwd in self._get_passwords_to_try(password, use_default):
+                if reader.decrypt(pwd):
+                    self.logger.info("Successfully decrypted PDF with password")
+                    return data, pwd
+            
+            raise PDFDecryptionError("Failed to decrypt PDF with provided passwords")
+            
+        except PDFDecryptionError:
+            raise
+        except PdfReadError as e:
             raise PDFDecryptionError(f"PDF read error: {str(e)}")
         except Exception as e:
             raise PDFDecryptionError(f"Unexpected error during decryption: {str(e)}")
     
+    def _decrypt_bytes_with_pikepdf(
+        self,
+        data: bytes,
+        password: Union[str, Sequence[str], None],
+        use_default: bool
+    ) -> bytes:
+        """Decrypt PDF bytes with pikepdf.
+        
+        Args:
+            data: Raw PDF bytes.
+            password: Optional password, or list of candidate passwords, to try.
+            use_default: Whether to try default password if provided one fails.
+            
+        Returns:
+            Unencrypted PDF bytes (the input itself if it was not encrypted).
+            
+        Raises:
+            PDFDecryptionError: If no password opens the PDF.
+        """
+        try:
+            with pikepdf.open(io.BytesIO(data)) as pdf:
+                if not pdf.is_encrypted:
+                    return data
+        except pikepdf.PasswordError:
+            pass
+        
+        for pwd in self._get_passwords_to_try(password, use_default):
+            try:
+                with pikepdf.open(io.BytesIO(data), password=pwd) as pdf:
+                    output = io.BytesIO()
+                    pdf.save(output)
+                    self.logger.info("Successfully decrypted PDF with password")
+                    return output.getvalue()
+            except pikepdf.PasswordError:
+                continue
+        
+        raise PDFDecryptionError("Failed to decrypt PDF with provided passwords")
+    
+    def _find_password_with_pikepdf(self, pdf_path: str, passwords: List[str]) -> Optional[str]:
+        """Find which candidate password opens a PDF, using pikepdf.
+        
+        Args:
+            pdf_path: Path to encrypted PDF file.
+            passwords: Candidate passwords in order.
+            
+        Returns:
+            The first password that opens the PDF, or None.
+        """
+        for pwd in passwords:
+            try:
+                with pikepdf.open(pdf_path, password=pwd):
+                    return pwd
+            except pikepdf.PasswordError:
+                continue
+        
+        return None
+    
+    def _get_passwords_to_try(
+        self,
+        password: Union[str, Sequence[str], None],
+        use_default: bool
+    ) -> List[str]:
+        """Build the ordered list of candidate passwords.
+        
+        The default password file is read once here, not per attempt.
+        
+        Args:
+            password: Optional password, or list of candidates, to try first.
+            use_default: Whether to append the default password.
+            
+        Returns:
+            List of unique passwords to try.
+        """
+        passwords_to_try = []
+        
+        candidates = [password] if isinstance(password, str) else list(password or [])
+        for candidate in candidates:
+            if candidate and candidate not in passwords_to_try:
+                passwords_to_try.append(candidate)
+        
+        if use_default:
+            try:
+                default_password = self.load_default_password()
+                if default_password not in passwords_to_try:
+                    passwords_to_try.append(default_password)
+            except PDFDecryptionError:
+                self.logger.warning("Could not load default password")
+        
+        return passwords_to_try
+    
     def verify_decryption(self, reader: PdfReader) -> bool:
         """Verify that PDF is properly decrypted.
         
@@ -151,11 +336,15 @@ class PDFDecryptor:
         except Exception:
             return False
     
-    def get_pdf_info(self, reader: PdfReader) -> dict:
-        """Extract metadata from decrypted PDF.
+    def get_pdf_metadata(self, reader: PdfReader, include_page_count: bool = False) -> dict:
+        """Extract document metadata from decrypted PDF.
+        
+        Only the document info dictionary is read unless a page count is
+        requested, since counting pages resolves the whole page tree.
         
         Args:
             reader: Decrypted PdfReader object.
+            include_page_count: Whether to add "page_count" to the result.
             
         Returns:
             Dictionary containing PDF metadata.
@@ -171,15 +360,42 @@ class PDFDecryptor:
                 "producer": metadata.get('/Producer', ''),
                 "creation_date": metadata.get('/CreationDate', ''),
                 "modification_date": metadata.get('/ModDate', ''),
-                "page_count": len(reader.pages),
                 "is_encrypted": reader.is_encrypted,
             }
             
-            return info
-            
         except Exception as e:
             self.logger.warning(f"Failed to extract PDF metadata: {str(e)}")
-            return {
-                "page_count": len(reader.pages) if reader.pages else 0,
+            info = {
                 "is_encrypted": reader.is_encrypted if reader else False,
-            }
\ No newline at end of file
+            }
+        
+        if include_page_count:
+            info["page_count"] = self.get_pdf_page_count(reader)
+        
+        return info
+    
+    def get_pdf_page_count(self, reader: PdfReader) -> int:
+        """Get the number of pages in decrypted PDF.
+        
+        Args:
+            reader: Decrypted PdfReader object.
+            
+        Returns:
+            Number of pages, or 0 if the page tree cannot be read.
+        """
+        try:
+            return len(reader.pages)
+        except Exception as e:
+            self.logger.warning(f"Failed to count PDF pages: {str(e)}")
+            return 0
+    
+    def get_pdf_info(self, reader: PdfReader) -> dict:
+        """Extract metadata and page count from decrypted PDF.
+        
+        Args:
+            reader: Decrypted PdfReader object.
+            
+        Returns:
+            Dictionary containing PDF metadata, including "page_count".
+        """
+        return self.get_pdf_metadata(reader, include_page_count=True)
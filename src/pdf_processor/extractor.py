@@ -1,15 +1,43 @@
 """PDF data extraction utilities for bank statement processing."""
 
+import os
 import re
-from typing import Dict, List, Optional, Tuple, Any
-from decimal import Decimal
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import pdfplumber
 import pandas as pd
 from PyPDF2 import PdfReader
 
+from src.pdf_processor._fastparse import (
+    DATE_PATTERN_STRINGS,
+    DATE_PATTERNS,
+    parse_amount as _parse_amount,
+    parse_date as _parse_date,
+)
 from src.utils.logger import get_logger
 
+# Single alternation used to reject lines without any date in one pass;
+# groups are made non-capturing so pandas' str.contains stays quiet
+_ANY_DATE_RE = re.compile(
+    '|'.join(p.replace('(', '(?:', 1) for p in DATE_PATTERN_STRINGS),
+    re.IGNORECASE
+)
+
+# parse_date results are memoized per input string, since statement rows
+# from the same day repeat the same date cell
+_parse_date_cached = functools.lru_cache(maxsize=8192)(_parse_date)
+
+# Keywords marking summary rows inside transaction tables
+_SUMMARY_ROW_KEYWORDS = ('TOTAL', 'SUMMARY', 'STATEMENT PERIOD')
+
+# Column order of transaction DataFrames (matches TransactionData.to_dict)
+TRANSACTION_COLUMNS = ["Date", "Description", "Debit", "Credit", "Balance", "Reference"]
+
+# Tokens in a text line that look like amounts
+_AMOUNT_TOKEN_RE = re.compile(r'\d+(?:[.,]\d{2})?')
+
 
 class PDFExtractionError(Exception):
     """Custom exception for PDF extraction errors."""
@@ -19,13 +47,16 @@ class PDFExtractionError(Exception):
 class TransactionData:
     """Data class for transaction information."""
     
+    # No per-instance __dict__; statements can produce tens of thousands of rows
+    __slots__ = ("date", "description", "debit", "credit", "balance", "reference")
+    
     def __init__(
         self,
         date: str,
         description: str,
-        debit: Optional[Decimal] = None,
-        credit: Optional[Decimal] = None,
-        balance: Optional[Decimal] = None,
+        debit: Optional[float] = None,
+        credit: Optional[float] = None,
+        balance: Optional[float] = None,
         reference: Optional[str] = None
     ) -> None:
         """Initialize transaction data.
@@ -68,16 +99,13 @@ class PDFExtractor:
         """Initialize PDF extractor."""
         self.logger = get_logger(__name__)
         
-        # Common patterns for transaction extraction
-        self.date_patterns = [
-            r'\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})\b',  # DD/MM/YYYY or DD-MM-YYYY
-            r'\b(\d{4}[/-]\d{1,2}[/-]\d{1,2})\b',  # YYYY/MM/DD or YYYY-MM-DD
-            r'\b(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{2,4})\b',  # DD Mon YYYY
-        ]
+        # Common patterns for transaction extraction, compiled once at import
+        self.date_patterns = list(DATE_PATTERNS)
+        self.any_date_pattern = _ANY_DATE_RE
         
         self.amount_patterns = [
-            r'\b(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\b',  # 1,234.56
-            r'\b(\d+(?:\.\d{2})?)\b',  # 1234.56
+            re.compile(r'\b(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\b'),  # 1,234.56
+            re.compile(r'\b(\d+(?:\.\d{2})?)\b'),  # 1234.56
         ]
         
         # Keywords to identify transaction sections
@@ -86,11 +114,39 @@ class PDFExtractor:
             'payment', 'transfer', 'charge', 'fee', 'interest'
         ]
     
-    def extract_text_from_pdf(self, pdf_path: str, password: Optional[str] = None) -> List[str]:
+    def _open_pdf(
+        self,
+        pdf_path: Union[str, BinaryIO],
+        password: Optional[str] = None,
+        pages: Optional[List[int]] = None
+    ) -> pdfplumber.PDF:
+        """Open a PDF file with pdfplumber.
+        
+        The returned object is a context manager, so callers can open the
+        file once and share it between extraction steps.
+        
+        Args:
+            pdf_path: Path to PDF file or binary file-like object.
+            password: Optional PDF password.
+            pages: Optional 1-based page numbers to restrict the PDF to.
+            
+        Returns:
+            Open pdfplumber PDF object.
+        """
+        return pdfplumber.open(pdf_path, password=password, pages=pages)
+    
+    def extract_text_from_pdf(
+        self,
+        pdf_path: str,
+        password: Optional[str] = None,
+        pdf: Optional[pdfplumber.PDF] = None
+    ) -> List[str]:
         """Extract text content from PDF file.
         
         Args:
             pdf_path: Path to PDF file.
+            password: Optional PDF password.
+            pdf: Optional already-open pdfplumber PDF to read instead of pdf_path.
             
         Returns:
             List of text strings, one per page.
@@ -99,20 +155,11 @@ class PDFExtractor:
             PDFExtractionError: If text extraction fails.
         """
         try:
-            text_content = []
-            
-            with pdfplumber.open(pdf_path, password=password) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text_content.append(page_text)
-                            self.logger.debug(f"Extracted text from page {page_num}")
-                        else:
-                            self.logger.warning(f"No text found on page {page_num}")
-                    except Exception as e:
-                        self.logger.warning(f"Failed to extract text from page {page_num}: {str(e)}")
-                        continue
+            if pdf is None:
+                with self._open_pdf(pdf_path, password) as pdf:
+                    text_content = self._extract_page_text(pdf)
+            else:
+                text_content = self._extract_page_text(pdf)
             
             if not text_content:
                 raise PDFExtractionError("No text content extracted from PDF")
@@ -123,11 +170,44 @@ class PDFExtractor:
         except Exception as e:
             raise PDFExtractionError(f"Failed to extract text from PDF: {str(e)}")
     
-    def extract_tables_from_pdf(self, pdf_path: str, password: Optional[str] = None) -> List[List[List[str]]]:
+    def _extract_page_text(self, pdf: pdfplumber.PDF) -> List[str]:
+        """Extract text from every page of an open PDF.
+        
+        Args:
+            pdf: Open pdfplumber PDF object.
+            
+        Returns:
+            List of text strings for pages that contain text.
+        """
+        text_content = []
+        
+        for page_num, page in enumerate(pdf.pages, 1):
+            try:
+                # Line text is all the parsers need, so skip word/layout clustering
+                page_text = page.extract_text_simple()
+                if page_text:
+                    text_content.append(page_text)
+                    self.logger.debug(f"Extracted text from page {page_num}")
+                else:
+                    self.logger.warning(f"No text found on page {page_num}")
+            except Exception as e:
+                self.logger.warning(f"Failed to extract text from page {page_num}: {str(e)}")
+                continue
+        
+        return text_content
+    
+    def extract_tables_from_pdf(
+        self,
+        pdf_path: str,
+        password: Optional[str] = None,
+        pdf: Optional[pdfplumber.PDF] = None
+    ) -> List[List[List[str]]]:
         """Extract table data from PDF file.
         
         Args:
             pdf_path: Path to PDF file.
+            password: Optional PDF password.
+            pdf: Optional already-open pdfplumber PDF to read instead of pdf_path.
             
         Returns:
             List of tables, where each table is a list of rows and each row is a list of cells.
@@ -136,18 +216,11 @@ class PDFExtractor:
             PDFExtractionError: If table extraction fails.
         """
         try:
-            all_tables = []
-            
-            with pdfplumber.open(pdf_path, password=password) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    try:
-                        tables = page.extract_tables()
-                        if tables:
-                            all_tables.extend(tables)
-                            self.logger.debug(f"Extracted {len(tables)} tables from page {page_num}")
-                    except Exception as e:
-                        self.logger.warning(f"Failed to extract tables from page {page_num}: {str(e)}")
-                        continue
+            if pdf is None:
+                with self._open_pdf(pdf_path, password) as pdf:
+                    all_tables = self._extract_page_tables(pdf)
+            else:
+                all_tables = self._extract_page_tables(pdf)
             
             self.logger.info(f"Extracted total of {len(all_tables)} tables")
             return all_tables
@@ -155,113 +228,105 @@ class PDFExtractor:
         except Exception as e:
             raise PDFExtractionError(f"Failed to extract tables from PDF: {str(e)}")
     
-    def parse_amount(self, amount_str: str) -> Optional[Decimal]:
-        """Parse amount string to Decimal.
+    def _extract_page_tables(self, pdf: pdfplumber.PDF) -> List[List[List[str]]]:
+        """Extract tables from every page of an open PDF.
         
         Args:
-            amount_str: String containing amount.
+            pdf: Open pdfplumber PDF object.
             
         Returns:
-            Parsed Decimal amount or None if parsing fails.
+            List of tables found across all pages.
         """
-        try:
-            if not amount_str or amount_str.strip() in ['', '-', '0.00', '0']:
-                return None
-                
-            # Remove currency symbols and whitespace, but keep negative sign
-            clean_amount = re.sub(r'[^\d.,-]', '', amount_str.strip())
-            
-            if not clean_amount:
-                return None
-            
-            # Handle different decimal separators
-            if ',' in clean_amount and '.' in clean_amount:
-                # If both exist, assume comma is thousands separator
-                clean_amount = clean_amount.replace(',', '')
-            elif ',' in clean_amount:
-                # Check if comma is decimal separator (last occurrence)
-                last_comma = clean_amount.rfind(',')
-                if len(clean_amount) - last_comma - 1 <= 2:
-                    # Likely decimal separator
-                    clean_amount = clean_amount.replace(',', '.')
-                else:
-                    # Likely thousands separator
-                    clean_amount = clean_amount.replace(',', '')
+        return list(self._iter_page_tables(pdf))
+    
+    def _iter_page_tables(self, pdf: pdfplumber.PDF) -> Iterator[List[List[str]]]:
+        """Yield tables page by page from an open PDF.
+        
+        Lets callers parse each table as soon as it is extracted instead of
+        holding every raw table of a large statement at once.
+        
+        Args:
+            pdf: Open pdfplumber PDF object.
             
-            return Decimal(str(clean_amount))
+        Yields:
+            Tables as lists of rows.
+        """
+        for page_num, page in enumerate(pdf.pages, 1):
+            try:
+                tables = page.extract_tables()
+            except Exception as e:
+                self.logger.warning(f"Failed to extract tables from page {page_num}: {str(e)}")
+                continue
+            
+            if tables:
+                self.logger.debug(f"Extracted {len(tables)} tables from page {page_num}")
+                yield from tables
+    
+    def parse_amount(self, amount_str: str) -> Optional[float]:
+        """Parse amount string to float.
+        
+        Args:
+            amount_str: String containing amount.
             
-        except (ValueError, TypeError):
+        Returns:
+            Parsed amount or None if parsing fails.
+        """
+        if not isinstance(amount_str, str):
             return None
+        return _parse_amount(amount_str)
     
     def parse_date(self, date_str: str) -> Optional[str]:
         """Parse date string to standardized format.
         
+        Results are memoized per input string, since statement rows from the
+        same day repeat the same date cell.
+        
         Args:
             date_str: String containing date.
             
         Returns:
             Standardized date string (YYYY-MM-DD) or None if parsing fails.
         """
-        try:
-            from datetime import datetime
-            
-            # Try different date patterns
-            for pattern in self.date_patterns:
-                match = re.search(pattern, date_str, re.IGNORECASE)
-                if match:
-                    date_value = match.group(1)
-                    # Normalize date format
-                    date_value = date_value.replace('/', '-').replace(' ', '-')
-                    
-                    # Handle different formats
-                    parts = date_value.split('-')
-                    if len(parts) == 3:
-                        # Try to determine format
-                        if len(parts[0]) == 4:  # YYYY-MM-DD
-                            year = parts[0]
-                            month = parts[1]
-                            day = parts[2]
-                        elif len(parts[2]) == 4:  # DD-MM-YYYY
-                            year = parts[2]
-                            month = parts[1]
-                            day = parts[0]
-                        elif len(parts[2]) == 2:  # DD-MM-YY
-                            year = f"20{parts[2]}" if int(parts[2]) < 50 else f"19{parts[2]}"
-                            month = parts[1]
-                            day = parts[0]
-                        else:
-                            continue
-                        
-                        # Handle month names (Nov, Jan, etc.)
-                        if not month.isdigit():
-                            # Convert month name to number
-                            try:
-                                month_num = datetime.strptime(month, '%b').month
-                                month = f"{month_num:02d}"
-                            except ValueError:
-                                continue
-                        else:
-                            month = month.zfill(2)
-                        
-                        day = day.zfill(2)
-                        
-                        # Validate the date
-                        try:
-                            datetime.strptime(f"{year}-{month}-{day}", '%Y-%m-%d')
-                            return f"{year}-{month}-{day}"
-                        except ValueError:
-                            continue
-            
+        if not isinstance(date_str, str):
             return None
+        return _parse_date_cached(date_str)
+    
+    def _find_header_row(self, table: List[List[str]]) -> Tuple[Optional[List[str]], int]:
+        """Locate the M-PESA transaction header row in a table.
+        
+        Args:
+            table: Table data as list of rows.
             
-        except Exception:
-            return None
+        Returns:
+            Tuple of (header row, its index), or (None, -1) if not found.
+        """
+        for idx, row in enumerate(table):
+            if not row or len(row) < 6:  # Expect at least 6 columns for M-PESA format
+                continue
+            
+            # 'BALANCE' has no spaces, so it can only match inside a single
+            # cell; reject rows without it before joining the whole row
+            if not any('BALANCE' in str(cell).upper() for cell in row):
+                continue
+            
+            row_str = ' '.join([str(cell).upper() for cell in row])
+            if 'PAID IN' in row_str and ('WITHDRAWN' in row_str or 'PAID OUT' in row_str):
+                return row, idx
+        
+        return None, -1
     
-    def extract_transactions_from_table(self, table: List[List[str]]) -> List[TransactionData]:
+    def extract_transactions_from_table(
+        self,
+        table: List[List[str]],
+        previous_header: Optional[List[str]] = None
+    ) -> List[TransactionData]:
         """Extract transactions from table data.
         
         Args:
             table: Table data as list of rows.
+            previous_header: Optional header row of the preceding table. It is
+                used when this table has no header of its own but the same
+                width, i.e. a table continued from the previous page.
             
         Returns:
             List of TransactionData objects.
@@ -269,25 +334,20 @@ class PDFExtractor:
         transactions = []
         
         try:
-            if not table or len(table) < 2:
+            if not table:
                 return transactions
             
             # Find header row to understand column structure
-            header_row = None
-            header_row_idx = -1
-            
-            for idx, row in enumerate(table):
-                if row and len(row) >= 6:  # Expect at least 6 columns for M-PESA format
-                    row_str = ' '.join([str(cell).upper() for cell in row])
-                    if ('PAID IN' in row_str and ('WITHDRAWN' in row_str or 'PAID OUT' in row_str) and 'BALANCE' in row_str):
-                        header_row = row
-                        header_row_idx = idx
-                        break
+            header_row, header_row_idx = self._find_header_row(table)
             
             if not header_row:
-                # Don't log warning for tables that don't contain transaction data
-                # This is normal for summary tables, verification codes, etc.
-                return transactions
+                if previous_header and table[0] and len(table[0]) == len(previous_header):
+                    # Continuation table: every row is data
+                    header_row, header_row_idx = previous_header, -1
+                else:
+                    # Don't log warning for tables that don't contain transaction data
+                    # This is normal for summary tables, verification codes, etc.
+                    return transactions
             
             # Map column indices
             col_mapping = {}
@@ -312,16 +372,19 @@ class PDFExtractor:
                 if len(row) < len(header_row):
                     continue
                 
+                # Stringify each cell once and reuse it for every check below
+                str_row = [str(cell) for cell in row]
+                
                 # Skip summary rows
-                row_str = ' '.join([str(cell) for cell in row]).upper()
-                if any(keyword in row_str for keyword in ['TOTAL', 'SUMMARY', 'STATEMENT PERIOD']):
+                row_str = ' '.join(str_row).upper()
+                if any(keyword in row_str for keyword in _SUMMARY_ROW_KEYWORDS):
                     continue
                 
                 try:
                     # Extract date from completion time column
                     date_str = ""
                     if 'date' in col_mapping:
-                        date_cell = str(row[col_mapping['date']]).strip()
+                        date_cell = str_row[col_mapping['date']].strip()
                         # Extract date part from datetime string
                         if ' ' in date_cell:
                             date_str = date_cell.split(' ')[0]
@@ -335,7 +398,7 @@ class PDFExtractor:
                     # Extract description
                     description = ""
                     if 'description' in col_mapping:
-                        description = str(row[col_mapping['description']]).strip()
+                        description = str_row[col_mapping['description']].strip()
                     
                     # Extract amounts
                     credit = None
@@ -344,13 +407,13 @@ class PDFExtractor:
                     
                     # Extract credit (Paid In)
                     if 'credit' in col_mapping:
-                        credit_str = str(row[col_mapping['credit']]).strip()
+                        credit_str = str_row[col_mapping['credit']].strip()
                         if credit_str and credit_str not in ['', '-', '0.00', '0']:
                             credit = self.parse_amount(credit_str)
                     
                     # Extract debit (Withdrawn)
                     if 'debit' in col_mapping:
-                        debit_str = str(row[col_mapping['debit']]).strip()
+                        debit_str = str_row[col_mapping['debit']].strip()
                         if debit_str and debit_str not in ['', '-', '0.00', '0']:
                             # Handle negative values in debit column
                             if debit_str.startswith('-'):
@@ -360,7 +423,7 @@ class PDFExtractor:
                     
                     # Extract balance
                     if 'balance' in col_mapping:
-                        balance_str = str(row[col_mapping['balance']]).strip()
+                        balance_str = str_row[col_mapping['balance']].strip()
                         if balance_str and balance_str not in ['', '-', '0.00', '0']:
                             balance = self.parse_amount(balance_str)
                     
@@ -397,85 +460,96 @@ class PDFExtractor:
         transactions = []
         
         try:
-            for page_text in text_content:
-                lines = page_text.split('\n')
+            if not text_content:
+                return transactions
+            
+            # Split, strip and date-filter every line in pandas' string layer
+            lines = pd.Series(text_content, dtype=object).str.split('\n').explode().str.strip()
+            candidate_lines = lines[lines.str.contains(self.any_date_pattern, na=False)]
+            
+            for line in candidate_lines:
+                # Look for transaction patterns
+                date_match = None
+                for pattern in self.date_patterns:
+                    match = pattern.search(line)
+                    if match:
+                        date_match = match
+                        break
                 
-                for line in lines:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    # Look for transaction patterns
-                    date_match = None
-                    for pattern in self.date_patterns:
-                        match = re.search(pattern, line, re.IGNORECASE)
-                        if match:
-                            date_match = match
-                            break
-                    
-                    if date_match:
-                        parsed_date = self.parse_date(date_match.group(1))
-                        if parsed_date:
-                            # Extract remaining information from the line
-                            parts = line.split()
-                            description_parts = []
-                            amounts = []
-                            
-                            for part in parts:
-                                # Check if part looks like an amount
-                                if re.search(r'\d+(?:[.,]\d{2})?', part):
-                                    amount = self.parse_amount(part)
-                                    if amount:
-                                        amounts.append(amount)
+                if date_match:
+                    parsed_date = self.parse_date(date_match.group(1))
+                    if parsed_date:
+                        # Extract remaining information from the line
+                        parts = line.split()
+                        description_parts = []
+                        amounts = []
+                        
+                        for part in parts:
+                            # Check if part looks like an amount
+                            if _AMOUNT_TOKEN_RE.search(part):
+                                amount = self.parse_amount(part)
+                                if amount:
+                                    amounts.append(amount)
+                            else:
+                                description_parts.append(part)
+                        
+                        description = ' '.join(description_parts)
+                        
+                        # Determine debit/credit from amounts
+                        debit = None
+                        credit = None
+                        balance = None
+                        
+                        if len(amounts) >= 1:
+                            # Simple heuristic: if there are multiple amounts,
+                            # first might be transaction amount, second might be balance
+                            if len(amounts) == 2:
+                                if amounts[1] > amounts[0]:
+                                    credit = amounts[0]
+                                    balance = amounts[1]
                                 else:
-                                    description_parts.append(part)
-                            
-                            description = ' '.join(description_parts)
-                            
-                            # Determine debit/credit from amounts
-                            debit = None
-                            credit = None
-                            balance = None
-                            
-                            if len(amounts) >= 1:
-                                # Simple heuristic: if there are multiple amounts,
-                                # first might be transaction amount, second might be balance
-                                if len(amounts) == 2:
-                                    if amounts[1] > amounts[0]:
-                                        credit = amounts[0]
-                                        balance = amounts[1]
-                                    else:
-                                        debit = amounts[0]
-                                        balance = amounts[1]
+                                    debit = amounts[0]
+                                    balance = amounts[1]
+                            else:
+                                # Single amount - determine if debit or credit
+                                # This logic may need refinement based on bank format
+                                if 'debit' in description.lower() or 'withdrawal' in description.lower():
+                                    debit = amounts[0]
                                 else:
-                                    # Single amount - determine if debit or credit
-                                    # This logic may need refinement based on bank format
-                                    if 'debit' in description.lower() or 'withdrawal' in description.lower():
-                                        debit = amounts[0]
-                                    else:
-                                        credit = amounts[0]
-                            
-                            transaction = TransactionData(
-                                date=parsed_date,
-                                description=description,
-                                debit=debit,
-                                credit=credit,
-                                balance=balance
-                            )
-                            
-                            transactions.append(transaction)
-            
+                                    credit = amounts[0]
+                        
+                        transaction = TransactionData(
+                            date=parsed_date,
+                            description=description,
+                            debit=debit,
+                            credit=credit,
+                            balance=balance
+                        )
+                        
+                        transactions.append(transaction)
+        
             return transactions
             
         except Exception as e:
             self.logger.warning(f"Failed to extract transactions from text: {str(e)}")
             return []
     
-    def extract_all_transactions(self, pdf_path: str, password: Optional[str] = None) -> List[TransactionData]:
+    def extract_all_transactions(
+        self,
+        pdf_path: Union[str, BinaryIO],
+        password: Optional[str] = None,
+        workers: Optional[int] = None
+    ) -> List[TransactionData]:
         """Extract all transactions from PDF using multiple methods.
         
         Args:
-            pdf_path: Path to PDF file.
+            pdf_path: Path to PDF file or binary file-like object, e.g. the
+                already-decrypted bytes from PDFDecryptor.decrypt_to_bytes.
+            password: Optional PDF password.
+            workers: Optional number of worker processes. With more than one,
+                page ranges of a PDF path are extracted in parallel; the
+                pdfminer table extraction dominates the runtime and is
+                GIL-bound, so processes rather than threads are used.
             
         Returns:
             List of all TransactionData objects found.
@@ -486,37 +560,280 @@ class PDFExtractor:
         all_transactions = []
         
         try:
-            # Try table extraction first (usually more reliable)
-            self.logger.info("Attempting table extraction...")
-            tables = self.extract_tables_from_pdf(pdf_path, password)
+            if workers and workers > 1 and isinstance(pdf_path, str):
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    all_transactions = self._extract_split_pdf(executor, pdf_path, password, workers)
+                
+                if not all_transactions:
+                    raise PDFExtractionError("No transactions could be extracted from PDF")
+                return all_transactions
             
-            for table in tables:
-                transactions = self.extract_transactions_from_table(table)
-                all_transactions.extend(transactions)
+            # Open the PDF once and share it between table and text extraction
+            with self._open_pdf(pdf_path, password) as pdf:
+                all_transactions = self._extract_transactions_by_page(pdf)
             
-            # If no transactions found from tables, try text extraction
-            if not all_transactions:
-                self.logger.info("No transactions from tables, trying text extraction...")
-                text_content = self.extract_text_from_pdf(pdf_path, password)
-                transactions = self.extract_transactions_from_text(text_content)
-                all_transactions.extend(transactions)
+            return self._finalize_transactions(all_transactions)
             
-            if not all_transactions:
-                raise PDFExtractionError("No transactions could be extracted from PDF")
+        except Exception as e:
+            raise PDFExtractionError(f"Failed to extract transactions: {str(e)}")
+    
+    def extract_transactions_from_pages(
+        self,
+        pdf_path: Union[str, BinaryIO],
+        start_page: int,
+        end_page: int,
+        password: Optional[str] = None
+    ) -> List[TransactionData]:
+        """Extract transactions from a page range of a PDF.
+        
+        Only the requested pages are parsed, so a chunk of a large statement
+        can be read straight from the full document without writing it out
+        as a separate PDF first.
+        
+        Args:
+            pdf_path: Path to PDF file or binary file-like object.
+            start_page: First page to extract (1-based).
+            end_page: Last page to extract (1-based, inclusive).
+            password: Optional PDF password.
             
-            # Remove duplicates and sort by date
-            unique_transactions = self._deduplicate_transactions(all_transactions)
-            sorted_transactions = sorted(
-                unique_transactions,
-                key=lambda x: (x.date, x.description)
-            )
+        Returns:
+            List of TransactionData objects found in the page range.
             
-            self.logger.info(f"Extracted {len(sorted_transactions)} unique transactions")
-            return sorted_transactions
+        Raises:
+            PDFExtractionError: If extraction fails completely.
+        """
+        try:
+            all_transactions = self._extract_raw_transactions(
+                pdf_path, password, list(range(start_page, end_page + 1))
+            )
+            return self._finalize_transactions(all_transactions)
             
         except Exception as e:
             raise PDFExtractionError(f"Failed to extract transactions: {str(e)}")
     
+    def extract_all_transactions_batch(
+        self,
+        pdf_paths: List[str],
+        password: Optional[str] = None,
+        workers: Optional[int] = None
+    ) -> Dict[str, List[TransactionData]]:
+        """Extract transactions from several PDFs using a process pool.
+        
+        pdfminer parsing is CPU-bound and holds the GIL, so work is spread
+        across processes. A single PDF is split into page ranges instead, so
+        one large statement still uses every worker. A failing file or page
+        range is logged and does not abort the rest of the batch.
+        
+        Args:
+            pdf_paths: Paths to PDF files.
+            password: Optional password shared by all PDFs.
+            workers: Number of worker processes (defaults to CPU count).
+            
+        Returns:
+            Dictionary mapping each PDF path to its sorted, de-duplicated
+            transactions (empty for files that failed).
+        """
+        workers = max(1, workers or os.cpu_count() or 1)
+        results: Dict[str, List[TransactionData]] = {}
+        
+        if not pdf_paths:
+            return results
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            if len(pdf_paths) == 1:
+                pdf_path = pdf_paths[0]
+                results[pdf_path] = self._extract_split_pdf(executor, pdf_path, password, workers)
+                return results
+            
+            futures = {
+                pdf_path: executor.submit(_extract_pages_worker, pdf_path, password, None)
+                for pdf_path in pdf_paths
+            }
+            
+            for pdf_path, future in futures.items():
+                try:
+                    results[pdf_path] = self._finalize_transactions(future.result())
+                except Exception as e:
+                    self.logger.error(f"Batch extraction failed for {pdf_path}: {str(e)}")
+                    results[pdf_path] = []
+        
+        return results
+    
+    def _extract_split_pdf(
+        self,
+        executor: ProcessPoolExecutor,
+        pdf_path: str,
+        password: Optional[str],
+        workers: int
+    ) -> List[TransactionData]:
+        """Extract one PDF by fanning its page ranges out to an executor.
+        
+        Args:
+            executor: Process pool to submit page ranges to.
+            pdf_path: Path to PDF file.
+            password: Optional PDF password.
+            workers: Number of page ranges to split into.
+            
+        Returns:
+            Sorted, de-duplicated transactions (empty on failure).
+        """
+        try:
+            with self._open_pdf(pdf_path, password) as pdf:
+                total_pages = len(pdf.pages)
+            
+            page_ranges = _split_page_ranges(total_pages, workers)
+            futures = [
+                executor.submit(_extract_pages_worker, pdf_path, password, pages, False)
+                for pages in page_ranges
+            ]
+            
+            all_transactions = []
+            for pages, future in zip(page_ranges, futures):
+                try:
+                    all_transactions.extend(future.result())
+                except Exception as e:
+                    self.logger.error(
+                        f"Batch extraction failed for {pdf_path} pages "
+                        f"{pages[0]}-{pages[-1]}: {str(e)}"
+                    )
+            
+            if not all_transactions:
+                # Same document-level fallback as a sequential run
+                self.logger.info("No transactions from tables, trying text extraction...")
+                with self._open_pdf(pdf_path, password) as pdf:
+                    all_transactions = self.extract_transactions_from_text(
+                        self._extract_page_text(pdf)
+                    )
+            
+            return self._finalize_transactions(all_transactions)
+            
+        except Exception as e:
+            self.logger.error(f"Batch extraction failed for {pdf_path}: {str(e)}")
+            return []
+    
+    def _extract_raw_transactions(
+        self,
+        pdf_path: Union[str, BinaryIO],
+        password: Optional[str] = None,
+        pages: Optional[List[int]] = None,
+        text_fallback: bool = True
+    ) -> List[TransactionData]:
+        """Extract transactions without de-duplication or sorting.
+        
+        Args:
+            pdf_path: Path to PDF file or binary file-like object.
+            password: Optional PDF password.
+            pages: Optional 1-based page numbers to restrict extraction to.
+            text_fallback: Whether to fall back to text extraction when the
+                tables yield no transactions.
+            
+        Returns:
+            List of TransactionData objects in page order.
+        """
+        header_row = None
+        if pages and pages[0] > 1:
+            # The range may start mid-table; carry over the header in effect
+            # at its first page, as a sequential run would
+            header_row = self._find_preceding_header(pdf_path, password, pages[0])
+        
+        with self._open_pdf(pdf_path, password, pages) as pdf:
+            return self._extract_transactions_by_page(pdf, header_row, text_fallback)
+    
+    def _find_preceding_header(
+        self,
+        pdf_path: Union[str, BinaryIO],
+        password: Optional[str],
+        page_number: int
+    ) -> Optional[List[str]]:
+        """Find the last transaction header before a page.
+        
+        Pages are scanned backwards, so a table continued over several
+        header-less pages still resolves to the header it started with.
+        
+        Args:
+            pdf_path: Path to PDF file or binary file-like object.
+            password: Optional PDF password.
+            page_number: 1-based page the search starts before.
+            
+        Returns:
+            The header row, or None if no earlier page has one.
+        """
+        with self._open_pdf(pdf_path, password, list(range(1, page_number))) as pdf:
+            for page in reversed(pdf.pages):
+                try:
+                    tables = page.extract_tables()
+                except Exception as e:
+                    self.logger.warning(f"Failed to extract tables from page {page.page_number}: {str(e)}")
+                    continue
+                
+                # The last header on the page is the one still in effect
+                for table in reversed(tables):
+                    header_row = self._find_header_row(table)[0]
+                    if header_row:
+                        return header_row
+        
+        return None
+    
+    def _extract_transactions_by_page(
+        self,
+        pdf: pdfplumber.PDF,
+        header_row: Optional[List[str]] = None,
+        text_fallback: bool = True
+    ) -> List[TransactionData]:
+        """Extract transactions from tables, falling back to text.
+        
+        Table extraction is tried first (usually more reliable). A
+        header-less table continuing a transaction table from the previous
+        page reuses that table's header. Text is only parsed when no table
+        yields any transaction, since the text parser misreads receipt
+        numbers and times as amounts.
+        
+        Args:
+            pdf: Open pdfplumber PDF object.
+            header_row: Optional header carried over from a preceding page.
+            text_fallback: Whether to fall back to text extraction when the
+                tables yield no transactions.
+            
+        Returns:
+            List of TransactionData objects.
+        """
+        all_transactions = []
+        
+        self.logger.info("Attempting table extraction...")
+        for table in self._iter_page_tables(pdf):
+            all_transactions.extend(self.extract_transactions_from_table(table, header_row))
+            header_row = self._find_header_row(table)[0] or header_row
+        
+        if not all_transactions and text_fallback:
+            self.logger.info("No transactions from tables, trying text extraction...")
+            all_transactions = self.extract_transactions_from_text(self._extract_page_text(pdf))
+        
+        return all_transactions
+    
+    def _finalize_transactions(self, all_transactions: List[TransactionData]) -> List[TransactionData]:
+        """De-duplicate and sort extracted transactions.
+        
+        Args:
+            all_transactions: Raw transactions from one PDF.
+            
+        Returns:
+            Sorted list of unique transactions.
+            
+        Raises:
+            PDFExtractionError: If no transactions were found.
+        """
+        if not all_transactions:
+            raise PDFExtractionError("No transactions could be extracted from PDF")
+        
+        # De-duplicate and sort in one pandas frame instead of a Python tuple sort
+        frame = self._deduplication_frame(all_transactions)
+        frame = frame[~frame.duplicated(subset=["date", "key_description", "debit", "credit"])]
+        frame = frame.sort_values(["date", "description"], kind="stable")
+        sorted_transactions = [all_transactions[i] for i in frame.index]
+        
+        self.logger.info(f"Extracted {len(sorted_transactions)} unique transactions")
+        return sorted_transactions
+    
     def _deduplicate_transactions(self, transactions: List[TransactionData]) -> List[TransactionData]:
         """Remove duplicate transactions based on date, description, and amount.
         
@@ -526,32 +843,102 @@ class PDFExtractor:
         Returns:
             List of unique transactions.
         """
-        seen = set()
-        unique_transactions = []
-        
-        for transaction in transactions:
-            # Create a unique key for the transaction
-            key = (
-                transaction.date,
-                transaction.description.lower().strip(),
-                transaction.debit,
-                transaction.credit
-            )
-            
-            if key not in seen:
-                seen.add(key)
-                unique_transactions.append(transaction)
+        if not transactions:
+            return []
         
-        return unique_transactions
+        frame = self._deduplication_frame(transactions)
+        is_duplicate = frame.duplicated(
+            subset=["date", "key_description", "debit", "credit"], keep="first"
+        ).tolist()
+        return [t for t, dup in zip(transactions, is_duplicate) if not dup]
+    
+    def _deduplication_frame(self, transactions: List[TransactionData]) -> pd.DataFrame:
+        """Build the DataFrame used to de-duplicate and sort transactions.
+        
+        Args:
+            transactions: List of transactions.
+            
+        Returns:
+            DataFrame indexed by list position, with the raw description for
+            sorting and a normalised "key_description" for de-duplication.
+        """
+        # Hash the key columns in pandas instead of building per-row tuples
+        frame = pd.DataFrame({
+            "date": [t.date for t in transactions],
+            "description": [t.description for t in transactions],
+            "debit": [t.debit for t in transactions],
+            "credit": [t.credit for t in transactions],
+        })
+        frame["key_description"] = frame["description"].str.lower().str.strip()
+        frame[["debit", "credit"]] = frame[["debit", "credit"]].astype(float)
+        return frame
     
-    def transactions_to_dataframe(self, transactions: List[TransactionData]) -> pd.DataFrame:
-        """Convert transactions list to pandas DataFrame.
+    def transactions_to_dataframe(self, transactions: Iterable[TransactionData]) -> pd.DataFrame:
+        """Convert transactions to pandas DataFrame.
+        
+        Rows are streamed into the DataFrame as tuples, so any iterable
+        (including a generator) works without building per-row dicts.
         
         Args:
-            transactions: List of TransactionData objects.
+            transactions: Iterable of TransactionData objects.
             
         Returns:
             pandas DataFrame containing transaction data.
         """
-        data = [transaction.to_dict() for transaction in transactions]
-        return pd.DataFrame(data)
\ No newline at end of file
+        records = (
+            (
+                t.date,
+                t.description,
+                float(t.debit) if t.debit else None,
+                float(t.credit) if t.credit else None,
+                float(t.balance) if t.balance else None,
+                t.reference,
+            )
+            for t in transactions
+        )
+        return pd.DataFrame.from_records(records, columns=TRANSACTION_COLUMNS)
+
+
+def _split_page_ranges(total_pages: int, parts: int) -> List[List[int]]:
+    """Split pages 1..total_pages into at most ``parts`` contiguous ranges.
+    
+    Args:
+        total_pages: Number of pages in the PDF.
+        parts: Desired number of ranges.
+        
+    Returns:
+        List of 1-based page number lists.
+    """
+    parts = max(1, min(parts, total_pages))
+    size, extra = divmod(total_pages, parts)
+    ranges = []
+    start = 1
+    
+    for i in range(parts):
+        end = start + size + (1 if i < extra else 0)
+        ranges.append(list(range(start, end)))
+        start = end
+    
+    return [pages for pages in ranges if pages]
+
+
+def _extract_pages_worker(
+    pdf_path: str,
+    password: Optional[str],
+    pages: Optional[List[int]],
+    text_fallback: bool = True
+) -> List[TransactionData]:
+    """Process-pool entry point for extracting one PDF or page range.
+    
+    Args:
+        pdf_path: Path to PDF file.
+        password: Optional PDF password.
+        pages: Optional 1-based page numbers to restrict extraction to.
+        text_fallback: Whether to fall back to text extraction when the
+            tables yield no transactions.
+        
+    Returns:
+        List of TransactionData objects in page order.
+    """
+    return PDFExtractor()._extract_raw_transactions(pdf_path, password, pages, text_fallback)
+
@@ -1,12 +1,25 @@
 """Celery application and task definitions for PDF processing."""
 
+import functools
+import hashlib
+import io
 import os
+import tempfile
+import time
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from decimal import Decimal
+from typing import Dict, List, Optional, Any, Tuple, Union
 
-from celery import Celery
+from celery import Celery, chord, group
 from celery.exceptions import Retry
+from kombu.serialization import register
+from PyPDF2 import PdfReader
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional faster serializer
+    orjson = None
 
 from src.config.settings import (
     CELERY_BROKER_URL,
@@ -15,6 +28,7 @@ from src.config.settings import (
     CELERY_RESULT_SERIALIZER,
     CELERY_ACCEPT_CONTENT,
     CELERY_TIMEZONE,
+    DEBUG,
     MAX_RETRIES,
     RETRY_DELAY_SECONDS,
     ensure_directories,
@@ -23,40 +37,219 @@ from src.excel_generator.converter import ExcelConverter, ExcelConversionError
 from src.excel_generator.summarizer import MonthlySummarizer, SummaryCalculationError
 from src.pdf_processor.chunker import PDFChunker, PDFChunkingError
 from src.pdf_processor.decryptor import PDFDecryptor, PDFDecryptionError
-from src.pdf_processor.extractor import PDFExtractor, PDFExtractionError
+from src.pdf_processor.extractor import PDFExtractor, PDFExtractionError, TransactionData
 from src.utils.logger import setup_logger, ProcessingLogger
 from src.utils.validators import ValidationError, validate_pdf_file
 
 # Ensure required directories exist
 ensure_directories()
 
+# Above this many chunks, chunk tasks are published in batches of
+# CHUNK_DISPATCH_BATCH_SIZE to cut broker round-trips
+CHUNK_BATCH_THRESHOLD = 20
+CHUNK_DISPATCH_BATCH_SIZE = 4
+
+# Decrypted statements are reused by the chunks of one statement only, so
+# they are held briefly and for at most a couple of statements per process
+DECRYPTED_PDF_CACHE_SIZE = 2
+DECRYPTED_PDF_CACHE_TTL_SECONDS = 300
+# (path, mtime_ns, size, password digest) -> (expiry, (PDF bytes, password))
+_decrypted_pdf_cache: Dict[Tuple, Tuple[float, Tuple[bytes, Optional[str]]]] = {}
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize values orjson does not handle natively, as kombu's json does.
+    
+    Args:
+        obj: Object orjson could not serialize.
+        
+    Returns:
+        JSON-compatible representation of the object.
+        
+    Raises:
+        TypeError: If the object cannot be serialized.
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    """Serialize a message body with orjson.
+    
+    Args:
+        obj: Message body.
+        
+    Returns:
+        Serialized body.
+    """
+    return orjson.dumps(
+        obj, default=_orjson_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+def _resolve_serializer(name: str) -> str:
+    """Fall back to json when orjson is configured but not installed.
+    
+    Args:
+        name: Configured serializer name.
+        
+    Returns:
+        Serializer name that is available in this process.
+    """
+    return "json" if name == "orjson" and orjson is None else name
+
+
+# Transaction lists make up most of the payload; orjson encodes and decodes
+# them several times faster than the stdlib json serializer
+if orjson is not None:
+    register(
+        "orjson", _orjson_dumps, orjson.loads,
+        content_type="application/x-orjson", content_encoding="binary"
+    )
+
 # Initialize Celery app
 celery_app = Celery(
     "pdf_processor",
     broker=CELERY_BROKER_URL,
     backend=CELERY_RESULT_BACKEND,
-    task_serializer=CELERY_TASK_SERIALIZER,
-    result_serializer=CELERY_RESULT_SERIALIZER,
-    accept_content=CELERY_ACCEPT_CONTENT,
+    task_serializer=_resolve_serializer(CELERY_TASK_SERIALIZER),
+    result_serializer=_resolve_serializer(CELERY_RESULT_SERIALIZER),
+    accept_content=sorted({_resolve_serializer(name) for name in CELERY_ACCEPT_CONTENT}),
     timezone=CELERY_TIMEZONE,
 )
 
 # Celery configuration
 celery_app.conf.update(
+    # Routes are keyed by the registered task names
     task_routes={
-        "src.tasks.celery_app.process_pdf_statement": {"queue": "pdf_processing"},
-        "src.tasks.celery_app.process_pdf_chunk": {"queue": "chunk_processing"},
-        "src.tasks.celery_app.generate_excel_report": {"queue": "report_generation"},
+        "process_pdf_statement": {"queue": "pdf_processing"},
+        "process_pdf_chunk": {"queue": "chunk_processing"},
+        "celery.starmap": {"queue": "chunk_processing"},
+        "generate_excel_report": {"queue": "report_generation"},
+        "finalize_statement": {"queue": "report_generation"},
     },
+    # Workers should also be started with ``-O fair`` so long-running PDF
+    # tasks are only handed to idle child processes.
     worker_prefetch_multiplier=1,
     task_acks_late=True,
-    worker_max_tasks_per_child=1000,
+    # Requeue tasks whose worker process dies so chunk jobs are not lost
+    task_reject_on_worker_lost=True,
+    # Chord fan-out publishes in bursts; keep enough broker connections pooled
+    broker_pool_limit=50,
+    result_backend_transport_options={"retry_policy": {"timeout": 5.0}},
+    # Bound result backend storage; chord keys are refreshed as chunks finish
+    result_expires=3600,
+    # Recycle children on memory growth rather than task count so imports
+    # and per-worker caches are kept warm across many tasks
+    worker_max_tasks_per_child=10000,
+    worker_max_memory_per_child=512_000,  # KB
 )
 
 # Setup logger
 logger = setup_logger("celery_tasks")
 
 
+# Processing components are stateless between tasks, so each worker process
+# builds them once and reuses them for every task it runs
+@functools.lru_cache(maxsize=1)
+def _get_decryptor() -> PDFDecryptor:
+    """Get the worker's shared PDF decryptor."""
+    return PDFDecryptor()
+
+
+def _decrypted_pdf_key(
+    pdf_path: str,
+    password: Union[str, List[str], None]
+) -> Tuple[str, int, int, str]:
+    """Build the decrypted-PDF cache key for one file version and password.
+    
+    Passwords are only kept as a SHA-256 digest so the key never holds them
+    in plain text.
+    
+    Args:
+        pdf_path: Path to PDF file.
+        password: Optional password, or list of candidate passwords.
+        
+    Returns:
+        Tuple of (path, mtime in ns, size in bytes, password digest).
+    """
+    file_stat = os.stat(pdf_path)
+    if isinstance(password, list):
+        password = "\0".join(password)
+    password_digest = hashlib.sha256((password or "").encode("utf-8")).hexdigest()
+    return pdf_path, file_stat.st_mtime_ns, file_stat.st_size, password_digest
+
+
+def _get_decrypted_pdf(
+    pdf_path: str,
+    password: Union[str, List[str], None] = None
+) -> Tuple[bytes, Optional[str]]:
+    """Get decrypted PDF bytes, reusing them across chunks of one statement.
+    
+    Entries expire after DECRYPTED_PDF_CACHE_TTL_SECONDS so decrypted
+    statements do not linger in long-lived workers.
+    
+    Args:
+        pdf_path: Path to PDF file.
+        password: Optional password, or list of candidate passwords.
+        
+    Returns:
+        Tuple of (PDF bytes, password still needed to open them or None).
+    """
+    key = _decrypted_pdf_key(pdf_path, password)
+    now = time.monotonic()
+    
+    for cached_key in [k for k, entry in _decrypted_pdf_cache.items() if entry[0] <= now]:
+        del _decrypted_pdf_cache[cached_key]
+    
+    entry = _decrypted_pdf_cache.get(key)
+    if entry is not None:
+        return entry[1]
+    
+    result = _get_decryptor().decrypt_to_bytes(pdf_path, password)
+    
+    while len(_decrypted_pdf_cache) >= DECRYPTED_PDF_CACHE_SIZE:
+        del _decrypted_pdf_cache[next(iter(_decrypted_pdf_cache))]
+    _decrypted_pdf_cache[key] = (now + DECRYPTED_PDF_CACHE_TTL_SECONDS, result)
+    return result
+
+
+def _evict_decrypted_pdf(pdf_path: str) -> None:
+    """Drop every cached decrypted copy of a PDF held by this process.
+    
+    Args:
+        pdf_path: Path to PDF file.
+    """
+    for cached_key in [k for k in _decrypted_pdf_cache if k[0] == pdf_path]:
+        del _decrypted_pdf_cache[cached_key]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_chunker() -> PDFChunker:
+    """Get the worker's shared PDF chunker."""
+    return PDFChunker()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_extractor() -> PDFExtractor:
+    """Get the worker's shared PDF extractor."""
+    return PDFExtractor()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_excel_converter() -> ExcelConverter:
+    """Get the worker's shared Excel converter."""
+    return ExcelConverter()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_summarizer() -> MonthlySummarizer:
+    """Get the worker's shared monthly summarizer."""
+    return MonthlySummarizer()
+
+
 @celery_app.task(bind=True, name="process_pdf_statement")
 def process_pdf_statement(
     self,
@@ -85,111 +278,76 @@ def process_pdf_statement(
         validate_pdf_file(pdf_path)
         processing_logger.log_start(pdf_path)
         
-        # Initialize components
-        decryptor = PDFDecryptor()
-        chunker = PDFChunker()
-        extractor = PDFExtractor()
-        excel_converter = ExcelConverter()
-        summarizer = MonthlySummarizer()
+        # Get shared components
+        decryptor = _get_decryptor()
+        chunker = _get_chunker()
+        extractor = _get_extractor()
         
         # Decrypt PDF
         processing_logger.log_progress("Decrypting PDF...")
-        reader = decryptor.decrypt_pdf(pdf_path, password)
-        
-        if not decryptor.verify_decryption(reader):
-            raise PDFDecryptionError("PDF decryption verification failed")
-        
-        # Get PDF info
+        pdf_bytes: Optional[bytes] = None
+        pdf_password: Optional[str] = None
+        if chunker.should_chunk(pdf_path):
+            # Chunk workers decrypt their own pages, so only open the reader
+            # lazily here; PyPDF2 derives the key and decrypts objects on access
+            reader = decryptor.decrypt_pdf(pdf_path, password)
+        else:
+            # Read and decrypt once; PyPDF2 and pdfplumber both work from these bytes
+            pdf_bytes, pdf_password = decryptor.decrypt_to_bytes(pdf_path, password)
+            reader = PdfReader(io.BytesIO(pdf_bytes))
+            if reader.is_encrypted:
+                reader.decrypt(pdf_password)
+        
+        # Get PDF info; a readable page count already shows that decryption
+        # worked, so the explicit first-page check only runs in debug mode
         pdf_info = decryptor.get_pdf_info(reader)
+        if pdf_info["page_count"] == 0 or (DEBUG and not decryptor.verify_decryption(reader)):
+            raise PDFDecryptionError("PDF decryption verification failed")
         processing_logger.log_progress(f"PDF loaded: {pdf_info['page_count']} pages")
         
         # Check if chunking is needed
         chunking_strategy = chunker.get_chunking_strategy(pdf_path, reader)
         
-        all_transactions = []
-        
         if chunking_strategy["should_chunk"]:
-            # Process in chunks
+            # Fan chunks out as a chord; the callback builds the report, so this
+            # worker is released instead of blocking on chunk results
             processing_logger.log_progress(f"Processing {chunking_strategy['chunk_count']} chunks...")
             
-            chunk_tasks = []
-            for start_page, end_page in chunking_strategy["chunk_ranges"]:
-                chunk_task = process_pdf_chunk.delay(
-                    pdf_path, start_page, end_page, password, task_id
+            chunk_args = [
+                (pdf_path, start_page, end_page, password, task_id)
+                for start_page, end_page in chunking_strategy["chunk_ranges"]
+            ]
+            if len(chunk_args) > CHUNK_BATCH_THRESHOLD:
+                header = process_pdf_chunk.chunks(chunk_args, CHUNK_DISPATCH_BATCH_SIZE).group()
+            else:
+                header = group(process_pdf_chunk.s(*args) for args in chunk_args)
+            finalize_result = chord(header)(
+                finalize_statement.s(
+                    pdf_path, generate_summary, output_filename,
+                    pdf_info, chunking_strategy, task_id
                 )
-                chunk_tasks.append(chunk_task)
-            
-            # Collect results from chunk tasks
-            for chunk_task in chunk_tasks:
-                try:
-                    chunk_result = chunk_task.get(timeout=300)  # 5 minutes timeout
-                    if chunk_result["success"]:
-                        all_transactions.extend(chunk_result["transactions"])
-                    else:
-                        processing_logger.log_error(
-                            Exception(chunk_result["error"]),
-                            f"Chunk processing failed for pages {chunk_result.get('start_page')}-{chunk_result.get('end_page')}"
-                        )
-                except Exception as e:
-                    processing_logger.log_error(e, "Failed to get chunk result")
-                    raise
-        
-        else:
-            # Process entire PDF at once
-            processing_logger.log_progress("Extracting transactions from PDF...")
-            all_transactions = extractor.extract_all_transactions(pdf_path)
-        
-        if not all_transactions:
-            raise PDFExtractionError("No transactions extracted from PDF")
-        
-        processing_logger.log_progress(f"Extracted {len(all_transactions)} transactions")
-        
-        # Generate Excel report
-        processing_logger.log_progress("Generating Excel report...")
-        
-        metadata = {
-            "source_file": os.path.basename(pdf_path),
-            "processing_date": datetime.now().isoformat(),
-            "task_id": task_id,
-            "total_transactions": len(all_transactions),
-            "pdf_info": pdf_info,
-            "chunking_strategy": chunking_strategy,
-        }
-        
-        if generate_summary:
-            # Generate comprehensive summary
-            processing_logger.log_progress("Generating monthly summary...")
-            summary_data = summarizer.generate_comprehensive_summary(all_transactions)
-            
-            output_path = excel_converter.create_summary_excel(
-                summary_data=summary_data,
-                transactions=all_transactions,
-                filename=output_filename
-            )
-            
-            result = {
-                "success": True,
-                "output_path": output_path,
-                "summary": summary_data,
-                "metadata": metadata,
-            }
-        else:
-            # Generate transactions-only Excel
-            output_path = excel_converter.convert_to_excel(
-                transactions=all_transactions,
-                filename=output_filename,
-                metadata=metadata
             )
             
-            result = {
+            return {
                 "success": True,
-                "output_path": output_path,
-                "transaction_count": len(all_transactions),
-                "metadata": metadata,
+                "status": "chunked",
+                "task_id": task_id,
+                "finalize_task_id": finalize_result.id,
+                "chunk_count": chunking_strategy["chunk_count"],
             }
         
-        processing_logger.log_completion(output_path)
-        return result
+        # Process entire PDF at once
+        processing_logger.log_progress("Extracting transactions from PDF...")
+        if pdf_bytes is None:
+            pdf_bytes, pdf_password = decryptor.decrypt_to_bytes(pdf_path, password)
+        all_transactions = extractor.extract_all_transactions(
+            io.BytesIO(pdf_bytes), pdf_password
+        )
+        
+        return _build_report(
+            task_id, processing_logger, pdf_path, all_transactions,
+            generate_summary, output_filename, pdf_info, chunking_strategy
+        )
         
     except (ValidationError, PDFDecryptionError, PDFExtractionError, 
             PDFChunkingError, ExcelConversionError, SummaryCalculationError) as e:
@@ -243,49 +401,41 @@ def process_pdf_chunk(
     Returns:
         Dictionary with chunk processing results.
     """
-    task_id = self.request.id
+    # Batched chunks run without their own request id
+    task_id = self.request.id or parent_task_id
     task_logger = ProcessingLogger(task_id)
     
     try:
-        # Initialize components
-        decryptor = PDFDecryptor()
-        chunker = PDFChunker()
-        extractor = PDFExtractor()
+        # Get shared components
+        extractor = _get_extractor()
         
-        # Decrypt PDF
-        reader = decryptor.decrypt_pdf(pdf_path, password)
+        # Decrypt PDF; other chunks of the same statement reuse the bytes
+        pdf_bytes, pdf_password = _get_decrypted_pdf(pdf_path, password)
         
-        # Create chunk
-        chunk_path = chunker.create_chunk(reader, start_page, end_page)
+        # Extract transactions from the chunk's pages without writing a chunk file
+        transactions = extractor.extract_transactions_from_pages(
+            io.BytesIO(pdf_bytes), start_page, end_page, pdf_password
+        )
         
-        try:
-            # Extract transactions from chunk
-            transactions = extractor.extract_all_transactions(chunk_path)
-            
-            result = {
-                "success": True,
-                "transactions": [t.to_dict() for t in transactions],
-                "start_page": start_page,
-                "end_page": end_page,
-                "transaction_count": len(transactions),
-                "task_id": task_id,
-                "parent_task_id": parent_task_id,
-            }
-            
-            task_logger.log_progress(f"Extracted {len(transactions)} transactions from pages {start_page}-{end_page}")
-            return result
-            
-        finally:
-            # Cleanup temporary chunk file
-            try:
-                os.remove(chunk_path)
-            except OSError:
-                pass
+        result = {
+            "success": True,
+            "transactions": [t.to_dict() for t in transactions],
+            "start_page": start_page,
+            "end_page": end_page,
+            "transaction_count": len(transactions),
+            "task_id": task_id,
+            "parent_task_id": parent_task_id,
+        }
+        
+        task_logger.log_progress(f"Extracted {len(transactions)} transactions from pages {start_page}-{end_page}")
+        return result
         
     except Exception as e:
         task_logger.log_error(e, f"Chunk processing failed for pages {start_page}-{end_page}")
         
-        if self.request.retries < MAX_RETRIES:
+        # Chunks run inside a batch are called directly and cannot be retried
+        # on their own; report the failure so the rest of the batch survives
+        if not self.request.called_directly and self.request.retries < MAX_RETRIES:
             raise self.retry(countdown=RETRY_DELAY_SECONDS, exc=e)
         
         return {
@@ -299,6 +449,194 @@ def process_pdf_chunk(
         }
 
 
+def _build_report(
+    task_id: str,
+    processing_logger: ProcessingLogger,
+    pdf_path: str,
+    all_transactions: List[TransactionData],
+    generate_summary: bool,
+    output_filename: Optional[str],
+    pdf_info: Dict[str, Any],
+    chunking_strategy: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Generate the Excel report for a processed statement.
+    
+    Shared by the single-pass path of process_pdf_statement and by
+    finalize_statement for chunked statements.
+    
+    Args:
+        task_id: ID of the statement's processing task.
+        processing_logger: Logger for the processing task.
+        pdf_path: Path to the source PDF file.
+        all_transactions: Extracted transactions.
+        generate_summary: Whether to generate monthly summary.
+        output_filename: Optional output filename.
+        pdf_info: PDF metadata from the decryptor.
+        chunking_strategy: Chunking strategy used for the PDF.
+        
+    Returns:
+        Dictionary with processing results.
+        
+    Raises:
+        PDFExtractionError: If no transactions were extracted.
+    """
+    if not all_transactions:
+        raise PDFExtractionError("No transactions extracted from PDF")
+    
+    processing_logger.log_progress(f"Extracted {len(all_transactions)} transactions")
+    
+    # Generate Excel report
+    processing_logger.log_progress("Generating Excel report...")
+    excel_converter = _get_excel_converter()
+    
+    metadata = {
+        "source_file": os.path.basename(pdf_path),
+        "processing_date": datetime.now().isoformat(),
+        "task_id": task_id,
+        "total_transactions": len(all_transactions),
+        "pdf_info": pdf_info,
+        "chunking_strategy": chunking_strategy,
+    }
+    
+    if generate_summary:
+        # Generate comprehensive summary
+        processing_logger.log_progress("Generating monthly summary...")
+        summary_data = _get_summarizer().generate_comprehensive_summary(all_transactions)
+        
+        output_path = excel_converter.create_summary_excel(
+            summary_data=summary_data,
+            transactions=all_transactions,
+            filename=output_filename
+        )
+        
+        result = {
+            "success": True,
+            "output_path": output_path,
+            "summary": summary_data,
+            "metadata": metadata,
+        }
+    else:
+        # Generate transactions-only Excel
+        output_path = excel_converter.convert_to_excel(
+            transactions=all_transactions,
+            filename=output_filename,
+            metadata=metadata
+        )
+        
+        result = {
+            "success": True,
+            "output_path": output_path,
+            "transaction_count": len(all_transactions),
+            "metadata": metadata,
+        }
+    
+    processing_logger.log_completion(output_path)
+    return result
+
+
+def _transactions_from_dicts(transactions: List[Dict[str, Any]]) -> List[TransactionData]:
+    """Convert serialized transaction dictionaries back to TransactionData.
+    
+    Args:
+        transactions: Transaction dictionaries as produced by to_dict().
+        
+    Returns:
+        List of TransactionData objects.
+    """
+    return [
+        TransactionData(
+            date=tx_dict["Date"],
+            description=tx_dict["Description"],
+            debit=float(tx_dict["Debit"]) if tx_dict["Debit"] else None,
+            credit=float(tx_dict["Credit"]) if tx_dict["Credit"] else None,
+            balance=float(tx_dict["Balance"]) if tx_dict["Balance"] else None,
+            reference=tx_dict.get("Reference"),
+        )
+        for tx_dict in transactions
+    ]
+
+
+def _flatten_chunk_results(chunk_results: List[Any]) -> List[Dict[str, Any]]:
+    """Flatten chord results that may contain per-batch result lists.
+    
+    Args:
+        chunk_results: Chunk results, or lists of them from batched dispatch.
+        
+    Returns:
+        Flat list of chunk result dictionaries in chunk order.
+    """
+    flattened = []
+    for chunk_result in chunk_results:
+        if isinstance(chunk_result, list):
+            flattened.extend(chunk_result)
+        else:
+            flattened.append(chunk_result)
+    return flattened
+
+
+@celery_app.task(bind=True, name="finalize_statement")
+def finalize_statement(
+    self,
+    chunk_results: List[Dict[str, Any]],
+    pdf_path: str,
+    generate_summary: bool,
+    output_filename: Optional[str],
+    pdf_info: Dict[str, Any],
+    chunking_strategy: Dict[str, Any],
+    parent_task_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """Merge chunk results and generate the report (chord callback).
+    
+    Args:
+        self: Celery task instance.
+        chunk_results: Results of process_pdf_chunk, in chunk order. Batched
+            dispatch yields one list of results per batch.
+        pdf_path: Path to the source PDF file.
+        generate_summary: Whether to generate monthly summary.
+        output_filename: Optional output filename.
+        pdf_info: PDF metadata from the decryptor.
+        chunking_strategy: Chunking strategy used for the PDF.
+        parent_task_id: ID of the process_pdf_statement task.
+        
+    Returns:
+        Dictionary with processing results.
+    """
+    task_id = parent_task_id or self.request.id
+    processing_logger = ProcessingLogger(task_id)
+    
+    # All chunks have finished; drop this process's decrypted copy, if any
+    _evict_decrypted_pdf(pdf_path)
+    
+    try:
+        all_transactions = []
+        for chunk_result in _flatten_chunk_results(chunk_results):
+            if chunk_result["success"]:
+                all_transactions.extend(_transactions_from_dicts(chunk_result["transactions"]))
+            else:
+                processing_logger.log_error(
+                    Exception(chunk_result["error"]),
+                    f"Chunk processing failed for pages {chunk_result.get('start_page')}-{chunk_result.get('end_page')}"
+                )
+        
+        return _build_report(
+            task_id, processing_logger, pdf_path, all_transactions,
+            generate_summary, output_filename, pdf_info, chunking_strategy
+        )
+        
+    except Exception as e:
+        processing_logger.log_error(e, "Failed to finalize chunked PDF processing")
+        
+        if self.request.retries < MAX_RETRIES:
+            raise self.retry(countdown=RETRY_DELAY_SECONDS, exc=e)
+        
+        return {
+            "success": False,
+            "error": str(e),
+            "task_id": task_id,
+            "retries": self.request.retries,
+        }
+
+
 @celery_app.task(bind=True, name="generate_excel_report")
 def generate_excel_report(
     self,
@@ -323,43 +661,21 @@ def generate_excel_report(
     task_logger = ProcessingLogger(task_id)
     
     try:
-        # Convert dictionaries back to TransactionData objects
-        from src.pdf_processor.extractor import TransactionData
-        from decimal import Decimal
-        
-        transaction_objects = []
-        for tx_dict in transactions:
-            transaction = TransactionData(
-                date=tx_dict["Date"],
-                description=tx_dict["Description"],
-                debit=Decimal(str(tx_dict["Debit"])) if tx_dict["Debit"] else None,
-                credit=Decimal(str(tx_dict["Credit"])) if tx_dict["Credit"] else None,
-                balance=Decimal(str(tx_dict["Balance"])) if tx_dict["Balance"] else None,
-                reference=tx_dict.get("Reference"),
-            )
-            transaction_objects.append(transaction)
-        
-        # Initialize Excel converter
-        excel_converter = ExcelConverter()
+        # Get shared Excel converter
+        excel_converter = _get_excel_converter()
         
-        # Generate Excel report
-        if summary_data:
-            output_path = excel_converter.create_summary_excel(
-                summary_data=summary_data,
-                transactions=transaction_objects,
-                filename=output_filename
-            )
-        else:
-            output_path = excel_converter.convert_to_excel(
-                transactions=transaction_objects,
-                filename=output_filename,
-                metadata=metadata
-            )
+        # Generate Excel report straight from the serialized transactions
+        output_path = excel_converter.convert_from_dicts(
+            transactions,
+            summary_data=summary_data,
+            filename=output_filename,
+            metadata=metadata
+        )
         
         result = {
             "success": True,
             "output_path": output_path,
-            "transaction_count": len(transaction_objects),
+            "transaction_count": len(transactions),
             "task_id": task_id,
         }
         
@@ -380,7 +696,7 @@ def generate_excel_report(
         }
 
 
-@celery_app.task(name="cleanup_temp_files")
+@celery_app.task(name="cleanup_temp_files", ignore_result=True)
 def cleanup_temp_files() -> Dict[str, Any]:
     """Clean up temporary files.
     
@@ -388,20 +704,18 @@ def cleanup_temp_files() -> Dict[str, Any]:
         Dictionary with cleanup results.
     """
     try:
-        import tempfile
-        import glob
-        
         temp_dir = tempfile.gettempdir()
-        pattern = os.path.join(temp_dir, "pdf_chunk_*.pdf")
-        temp_files = glob.glob(pattern)
         
+        # Match on directory entry names; no per-file stat is needed
         cleaned_count = 0
-        for temp_file in temp_files:
-            try:
-                os.remove(temp_file)
-                cleaned_count += 1
-            except OSError:
-                pass
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith("pdf_chunk_") and entry.name.endswith(".pdf"):
+                    try:
+                        os.unlink(entry.path)
+                        cleaned_count += 1
+                    except OSError:
+                        pass
         
         logger.info(f"Cleaned up {cleaned_count} temporary files")
         
@@ -1,18 +1,121 @@
 """Logging configuration and utilities for PDF processing system."""
 
+import atexit
 import logging
 import os
-from typing import Optional
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, WatchedFileHandler
+from typing import Dict, Optional
 
 from src.config.settings import LOG_LEVEL, LOG_FORMAT, LOGS_DIR
 
+LOG_MAX_BYTES = 50_000_000
+LOG_BACKUP_COUNT = 5
+
+# One queue handler and background listener per log file; loggers only
+# enqueue records and the listener thread does the console/disk writes
+_queue_handlers: Dict[str, QueueHandler] = {}
+_listeners: Dict[str, QueueListener] = {}
+
+# Only the process that loaded this module rotates log files. Forked children
+# (e.g. Celery prefork workers) append through WatchedFileHandler, which
+# reopens the file once it has been rotated, so several rotating handlers
+# never rename the same file under each other
+_rotating_pid = os.getpid()
+
+
+def _make_file_handler(log_path: str) -> logging.FileHandler:
+    """Create the file handler for a log file in the current process.
+    
+    Args:
+        log_path: Path of the log file.
+        
+    Returns:
+        A rotating handler in the owning process, a watched handler otherwise.
+    """
+    if os.getpid() == _rotating_pid:
+        return RotatingFileHandler(
+            log_path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT
+        )
+    return WatchedFileHandler(log_path)
+
+
+def _get_queue_handler(log_path: str) -> QueueHandler:
+    """Get the shared queue handler for a log file, starting its listener.
+    
+    Args:
+        log_path: Path of the log file.
+        
+    Returns:
+        Queue handler feeding the log file's listener.
+    """
+    handler = _queue_handlers.get(log_path)
+    if handler is not None:
+        return handler
+    
+    os.makedirs(os.path.dirname(log_path) or ".", exist_ok=True)
+    formatter = logging.Formatter(LOG_FORMAT)
+    
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+    
+    file_handler = _make_file_handler(log_path)
+    file_handler.setFormatter(formatter)
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, console_handler, file_handler)
+    listener.start()
+    
+    handler = QueueHandler(log_queue)
+    _listeners[log_path] = listener
+    _queue_handlers[log_path] = handler
+    return handler
+
+
+def _restart_listeners() -> None:
+    """Restart listener threads in a forked child, which does not inherit them.
+    
+    Each child gets fresh queues so records still pending in the parent are
+    not written twice, and swaps inherited rotating file handlers for watched
+    ones so only the parent rotates.
+    """
+    for log_path, listener in list(_listeners.items()):
+        handlers = []
+        for handler in listener.handlers:
+            if isinstance(handler, RotatingFileHandler):
+                watched = _make_file_handler(handler.baseFilename)
+                watched.setFormatter(handler.formatter)
+                handler.close()
+                handler = watched
+            handlers.append(handler)
+        
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _queue_handlers[log_path].queue = log_queue
+        restarted = QueueListener(log_queue, *handlers)
+        restarted.start()
+        _listeners[log_path] = restarted
+
+
+def _stop_listeners() -> None:
+    """Flush queued records and stop all listener threads."""
+    for listener in _listeners.values():
+        listener.stop()
+
+
+atexit.register(_stop_listeners)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listeners)
+
 
 def setup_logger(
     name: str,
     log_file: Optional[str] = None,
     level: str = LOG_LEVEL
 ) -> logging.Logger:
-    """Set up a logger with console and file handlers.
+    """Set up a logger writing to the console and a rotating log file.
+    
+    Records are handed to a background listener through a queue, so logging
+    calls never block on console or disk I/O.
     
     Args:
         name: Logger name.
@@ -23,29 +126,20 @@ def setup_logger(
         Configured logger instance.
     """
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
-    
-    # Clear existing handlers to avoid duplicates
-    logger.handlers.clear()
-    
-    # Create formatter
-    formatter = logging.Formatter(LOG_FORMAT)
     
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler
     if log_file is None:
         log_file = f"{name}.log"
     
-    log_path = os.path.join(LOGS_DIR, log_file)
-    os.makedirs(LOGS_DIR, exist_ok=True)
+    # Repeat calls with the same configuration leave the logger untouched
+    config = (log_file, level.upper())
+    if getattr(logger, "_setup_config", None) == config:
+        return logger
     
-    file_handler = logging.FileHandler(log_path)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    logger.setLevel(getattr(logging, level.upper()))
+    
+    # Replace existing handlers to avoid duplicates
+    logger.handlers = [_get_queue_handler(os.path.join(LOGS_DIR, log_file))]
+    logger._setup_config = config  # type: ignore[attr-defined]
     
     return logger
 
@@ -62,6 +156,21 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+_processing_logger: Optional[logging.Logger] = None
+
+
+def _get_processing_logger() -> logging.Logger:
+    """Get the logger shared by all processing tasks.
+    
+    Returns:
+        Logger writing to the processing log file.
+    """
+    global _processing_logger
+    if _processing_logger is None:
+        _processing_logger = setup_logger("processing")
+    return _processing_logger
+
+
 class ProcessingLogger:
     """Specialized logger for PDF processing operations."""
     
@@ -72,7 +181,9 @@ class ProcessingLogger:
             task_id: Unique identifier for the processing task.
         """
         self.task_id = task_id
-        self.logger = setup_logger(f"processing.{task_id}")
+        self.logger = logging.LoggerAdapter(
+            _get_processing_logger(), {"task_id": task_id}
+        )
     
     def log_start(self, file_path: str) -> None:
         """Log processing start.
@@ -1,6 +1,7 @@
 """Validation utilities for PDF processing system."""
 
 import os
+import stat
 from typing import List, Optional
 
 from src.config.settings import (
@@ -9,44 +10,99 @@ from src.config.settings import (
 )
 
 
+# Lowercased once for O(1) extension lookups
+_SUPPORTED_PDF_EXTENSIONS = frozenset(fmt.lower() for fmt in SUPPORTED_PDF_FORMATS)
+
+# PDF readers accept leading garbage before the header, so look for the
+# signature within the first kilobyte like they do
+PDF_MAGIC = b"%PDF-"
+PDF_HEADER_SEARCH_BYTES = 1024
+
+
 class ValidationError(Exception):
     """Custom exception for validation errors."""
     pass
 
 
-def validate_file_path(file_path: str) -> None:
-    """Validate that a file path exists and is accessible.
+def _stat_file(file_path: str) -> os.stat_result:
+    """Stat a file once and check that it is a regular file.
     
     Args:
         file_path: Path to the file to validate.
         
+    Returns:
+        Result of ``os.stat`` for the file.
+        
     Raises:
         ValidationError: If file path is invalid.
     """
     if not file_path:
         raise ValidationError("File path cannot be empty")
     
-    if not os.path.exists(file_path):
+    try:
+        file_stat = os.stat(file_path)
+    except PermissionError:
+        raise ValidationError(f"File is not readable: {file_path}")
+    except (OSError, ValueError):
         raise ValidationError(f"File does not exist: {file_path}")
     
-    if not os.path.isfile(file_path):
+    if not stat.S_ISREG(file_stat.st_mode):
         raise ValidationError(f"Path is not a file: {file_path}")
     
+    return file_stat
+
+
+def _stat_readable_file(file_path: str) -> os.stat_result:
+    """Stat a file once and check that it is a readable regular file.
+    
+    Args:
+        file_path: Path to the file to validate.
+        
+    Returns:
+        Result of ``os.stat`` for the file.
+        
+    Raises:
+        ValidationError: If file path is invalid.
+    """
+    file_stat = _stat_file(file_path)
+    
     if not os.access(file_path, os.R_OK):
         raise ValidationError(f"File is not readable: {file_path}")
+    
+    return file_stat
 
 
-def validate_file_size(file_path: str, max_size_mb: int = MAX_FILE_SIZE_MB) -> None:
-    """Validate file size against maximum allowed size.
+def _check_pdf_header(file_path: str) -> None:
+    """Check that a file starts with the PDF signature.
+    
+    Opening the file also serves as the readability check.
     
     Args:
         file_path: Path to the file to validate.
+        
+    Raises:
+        ValidationError: If the file cannot be read or is not a PDF.
+    """
+    try:
+        with open(file_path, "rb") as file:
+            header = file.read(PDF_HEADER_SEARCH_BYTES)
+    except OSError:
+        raise ValidationError(f"File is not readable: {file_path}")
+    
+    if PDF_MAGIC not in header:
+        raise ValidationError(f"File is not a valid PDF: {file_path}")
+
+
+def _check_file_size(file_size_bytes: int, max_size_mb: int) -> None:
+    """Check a file size in bytes against the maximum allowed size.
+    
+    Args:
+        file_size_bytes: File size in bytes.
         max_size_mb: Maximum allowed file size in MB.
         
     Raises:
         ValidationError: If file size exceeds limit.
     """
-    file_size_bytes = os.path.getsize(file_path)
     file_size_mb = file_size_bytes / (1024 * 1024)
     
     if file_size_mb > max_size_mb:
@@ -56,6 +112,31 @@ def validate_file_size(file_path: str, max_size_mb: int = MAX_FILE_SIZE_MB) -> N
         )
 
 
+def validate_file_path(file_path: str) -> None:
+    """Validate that a file path exists and is accessible.
+    
+    Args:
+        file_path: Path to the file to validate.
+        
+    Raises:
+        ValidationError: If file path is invalid.
+    """
+    _stat_readable_file(file_path)
+
+
+def validate_file_size(file_path: str, max_size_mb: int = MAX_FILE_SIZE_MB) -> None:
+    """Validate file size against maximum allowed size.
+    
+    Args:
+        file_path: Path to the file to validate.
+        max_size_mb: Maximum allowed file size in MB.
+        
+    Raises:
+        ValidationError: If file size exceeds limit.
+    """
+    _check_file_size(os.path.getsize(file_path), max_size_mb)
+
+
 def validate_file_extension(
     file_path: str,
     supported_formats: List[str] = SUPPORTED_PDF_FORMATS
@@ -69,9 +150,14 @@ def validate_file_extension(
     Raises:
         ValidationError: If file extension is not supported.
     """
-    _, ext = os.path.splitext(file_path.lower())
+    ext = os.path.splitext(file_path)[1].lower()
+    allowed = (
+        _SUPPORTED_PDF_EXTENSIONS
+        if supported_formats is SUPPORTED_PDF_FORMATS
+        else supported_formats
+    )
     
-    if ext not in supported_formats:
+    if ext not in allowed:
         raise ValidationError(
             f"File extension '{ext}' not supported. "
             f"Supported formats: {', '.join(supported_formats)}"
@@ -87,9 +173,12 @@ def validate_pdf_file(file_path: str) -> None:
     Raises:
         ValidationError: If any validation fails.
     """
-    validate_file_path(file_path)
-    validate_file_size(file_path)
+    # A single stat serves the existence, type and size checks, and one
+    # small read confirms the content is actually a PDF
+    file_stat = _stat_file(file_path)
+    _check_file_size(file_stat.st_size, MAX_FILE_SIZE_MB)
     validate_file_extension(file_path)
+    _check_pdf_header(file_path)
 
 
 def validate_directory_path(dir_path: str) -> None:
@@ -1,40 +1,64 @@
 """Pytest configuration and fixtures for PDF Bank Statement Processing System."""
 
-import os
-import tempfile
-import shutil
+import json
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
+import numpy as np
 import pytest
 import pandas as pd
-from typing import Dict, Any, List
+from typing import Any, Dict, List
 
 from src.config.settings import Settings
 
+SAMPLE_SETTINGS_KWARGS = {
+    "pdf_password": "test123",
+    "chunk_size_mb": 5,
+    "max_retries": 3,
+    "output_dir": "test_reports",
+    "log_level": "INFO",
+    "currency_symbol": "KES",
+    "default_currency": "KES",
+}
+
+# Session-scoped file fixtures share these files; tests must not modify them
+SAMPLE_PASSWORD_BYTES = b"test123\n"
+# A minimal PDF file (this would normally be a real PDF)
+SAMPLE_PDF_BYTES = b"%PDF-1.4\n1 0 obj\n<<\n/Type /Catalog\n/Pages 2 0 R\n>>\nendobj\n"
+
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
     """Create a temporary directory for test files."""
-    temp_path = tempfile.mkdtemp()
-    yield Path(temp_path)
-    shutil.rmtree(temp_path)
+    return tmp_path
 
 
 @pytest.fixture
 def sample_settings():
     """Create sample settings for testing."""
-    return Settings(
-        pdf_password="test123",
-        chunk_size_mb=5,
-        max_retries=3,
-        output_dir="test_reports",
-        log_level="INFO",
-        currency_symbol="KES",
-        default_currency="KES",
-    )
+    return Settings(**SAMPLE_SETTINGS_KWARGS)
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
+def generator():
+    """ExcelGenerator shared by one test class; it keeps no per-report state."""
+    from src.excel_generator import ExcelGenerator
+    return ExcelGenerator(Settings(**SAMPLE_SETTINGS_KWARGS))
+
+
+@pytest.fixture(scope="session")
+def make_settings():
+    """Factory building Settings with the given overrides.
+    
+    Each call returns a fresh instance, since tests mutate Settings in place.
+    """
+    def _make(**overrides: Any) -> Settings:
+        return Settings(**overrides)
+    
+    return _make
+
+
+@pytest.fixture(scope="session")
 def sample_pdf_data():
     """Create sample PDF data for testing."""
     return {
@@ -51,7 +75,7 @@ def sample_pdf_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transactions():
     """Create sample transaction data for testing."""
     return [
@@ -72,7 +96,7 @@ def sample_transactions():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_excel_data():
     """Create sample Excel data for testing."""
     return {
@@ -99,44 +123,53 @@ def sample_excel_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_pdf_reader():
-    """Create a mock PDF reader for testing."""
-    mock_reader = Mock()
-    mock_page = Mock()
-    mock_page.extract_text.return_value = "Sample PDF text content"
-    mock_reader.pages = [mock_page]
-    return mock_reader
+    """Create a read-only PDF reader stub for testing.
+    
+    Shared across the session; tests asserting on calls should build a Mock.
+    """
+    page = SimpleNamespace(extract_text=lambda: "Sample PDF text content")
+    return SimpleNamespace(pages=[page], is_encrypted=False, metadata=None)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_pdfplumber():
-    """Create a mock pdfplumber for testing."""
-    mock_pdf = Mock()
-    mock_page = Mock()
+    """Create a read-only pdfplumber document stub for testing.
+    
+    Shared across the session; tests asserting on calls should build a Mock.
+    """
     mock_table = [
         ["Receipt No.", "Completion Time", "Details", "Transaction Status", "Paid In", "Withdrawn", "Balance"],
         ["ABC123", "01/01/2023", "Test Transaction", "Completed", "100.00", "0.00", "1000.00"],
     ]
-    mock_page.extract_tables.return_value = [mock_table]
-    mock_pdf.pages = [mock_page]
-    return mock_pdf
+    page = SimpleNamespace(extract_tables=lambda: [mock_table])
+    return SimpleNamespace(pages=[page])
 
 
-@pytest.fixture
-def sample_password_file(temp_dir):
-    """Create a sample password file for testing."""
-    password_file = temp_dir / "test_password.txt"
-    password_file.write_text("test123\n")
+@pytest.fixture(scope="session")
+def sample_password_file(tmp_path_factory):
+    """Create a sample password file for testing, once per session."""
+    password_file = tmp_path_factory.mktemp("password") / "test_password.txt"
+    password_file.write_bytes(SAMPLE_PASSWORD_BYTES)
     return str(password_file)
 
 
-@pytest.fixture
-def sample_pdf_file(temp_dir):
-    """Create a sample PDF file for testing."""
-    pdf_file = temp_dir / "test.pdf"
-    # Create a minimal PDF file (this would normally be a real PDF)
-    pdf_file.write_bytes(b"%PDF-1.4\n1 0 obj\n<<\n/Type /Catalog\n/Pages 2 0 R\n>>\nendobj\n")
+@pytest.fixture(scope="session")
+def sample_config_bytes():
+    """Serialized sample configuration file contents, built once per session."""
+    return json.dumps({
+        "pdf_password": "file_password",
+        "chunk_size_mb": 10,
+        "log_level": "DEBUG",
+    }).encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def sample_pdf_file(tmp_path_factory):
+    """Create a sample PDF file for testing, once per session."""
+    pdf_file = tmp_path_factory.mktemp("pdf") / "test.pdf"
+    pdf_file.write_bytes(SAMPLE_PDF_BYTES)
     return str(pdf_file)
 
 
@@ -150,7 +183,7 @@ def mock_celery_app():
 
 
 @pytest.fixture
-def sample_environment():
+def sample_environment(monkeypatch):
     """Create sample environment variables for testing."""
     env_vars = {
         "PDF_PASSWORD": "test123",
@@ -161,11 +194,12 @@ def sample_environment():
         "CHUNK_SIZE_MB": "5",
         "MAX_RETRIES": "3",
     }
-    with patch.dict(os.environ, env_vars):
-        yield env_vars
+    for name, value in env_vars.items():
+        monkeypatch.setenv(name, value)
+    return env_vars
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def error_sample_data():
     """Create sample data that will cause errors for testing error handling."""
     return {
@@ -180,19 +214,40 @@ def error_sample_data():
     }
 
 
-@pytest.fixture
-def performance_test_data():
+# Month cycles every 12 rows and day every 28, so dates repeat every 84 rows
+_DATE_CYCLE = 84
+_DATE_LUT = np.array([
+    f"2023-{(k % 12) + 1:02d}-{(k % 28) + 1:02d}" for k in range(_DATE_CYCLE)
+])
+
+
+def _build_transactions(n: int) -> List[Dict[str, Any]]:
+    """Build n synthetic transaction rows column-wise."""
+    i = np.arange(n)
+    
+    # Build the columns vectorized, then hand tests the row dicts they expect
+    df = pd.DataFrame({
+        "date": np.take(_DATE_LUT, i % _DATE_CYCLE),
+        "description": "Transaction " + pd.Series(i, dtype=np.int64).astype(str),
+        "amount": ((i % 100) + 1).astype(np.float64),
+        "type": np.where(i % 2 == 0, "credit", "debit"),
+        "balance": ((i % 1000) + 100).astype(np.float64),
+    })
+    return df.to_dict("records")
+
+
+@pytest.fixture(scope="session")
+def make_transactions():
+    """Factory for n synthetic transaction rows."""
+    def _make(n: int = 1000) -> List[Dict[str, Any]]:
+        return _build_transactions(n)
+    return _make
+
+
+@pytest.fixture(scope="session")
+def performance_test_data(make_transactions):
     """Create large dataset for performance testing."""
-    transactions = []
-    for i in range(1000):
-        transactions.append({
-            "date": f"2023-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}",
-            "description": f"Transaction {i}",
-            "amount": float((i % 100) + 1),
-            "type": "credit" if i % 2 == 0 else "debit",
-            "balance": float((i % 1000) + 100),
-        })
-    return transactions
+    return make_transactions(1000)
 
 
 @pytest.fixture
@@ -204,9 +259,12 @@ def mock_redis():
         yield mock_client
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def cleanup_temp_files():
-    """Automatically clean up temporary files after each test."""
+    """Clean up temporary files a test leaves in the working directory.
+    
+    Opt-in: tests should write under temp_dir/tmp_path instead.
+    """
     yield
     # Clean up any temporary files that might have been created
     temp_patterns = ["temp_*.pdf", "test_*.xlsx", "*.tmp"]
@@ -1,5 +1,7 @@
 """Tests for configuration and settings modules."""
 
+import json
+import numpy as np
 import pytest
 import os
 from unittest.mock import patch, Mock
@@ -13,41 +15,72 @@ from src.config import settings
 class TestSettings:
     """Test cases for Settings class."""
 
-    def test_settings_init_default(self):
-        """Test Settings initialization with default values."""
-        settings_obj = Settings()
-        
-        assert settings_obj.pdf_password is None
-        assert settings_obj.chunk_size_mb == 5
-        assert settings_obj.max_retries == 3
-        assert settings_obj.output_dir == "reports"
-        assert settings_obj.log_level == "INFO"
-        assert settings_obj.currency_symbol == "KES"
-        assert settings_obj.default_currency == "KES"
-
-    def test_settings_init_custom(self):
-        """Test Settings initialization with custom values."""
-        settings_obj = Settings(
-            pdf_password="test123",
-            chunk_size_mb=10,
-            max_retries=5,
-            output_dir="custom_reports",
-            log_level="DEBUG",
-            currency_symbol="USD",
-            default_currency="USD",
-        )
-        
-        assert settings_obj.pdf_password == "test123"
-        assert settings_obj.chunk_size_mb == 10
-        assert settings_obj.max_retries == 5
-        assert settings_obj.output_dir == "custom_reports"
-        assert settings_obj.log_level == "DEBUG"
-        assert settings_obj.currency_symbol == "USD"
-        assert settings_obj.default_currency == "USD"
+    @pytest.mark.parametrize(
+        "factory, data, expected",
+        [
+            pytest.param(
+                lambda data: Settings(**data),
+                {},
+                {
+                    "pdf_password": None,
+                    "chunk_size_mb": 5,
+                    "max_retries": 3,
+                    "output_dir": "reports",
+                    "log_level": "INFO",
+                    "currency_symbol": "KES",
+                    "default_currency": "KES",
+                },
+                id="default",
+            ),
+            pytest.param(
+                lambda data: Settings(**data),
+                {
+                    "pdf_password": "test123",
+                    "chunk_size_mb": 10,
+                    "max_retries": 5,
+                    "output_dir": "custom_reports",
+                    "log_level": "DEBUG",
+                    "currency_symbol": "USD",
+                    "default_currency": "USD",
+                },
+                {
+                    "pdf_password": "test123",
+                    "chunk_size_mb": 10,
+                    "max_retries": 5,
+                    "output_dir": "custom_reports",
+                    "log_level": "DEBUG",
+                    "currency_symbol": "USD",
+                    "default_currency": "USD",
+                },
+                id="custom",
+            ),
+            pytest.param(
+                Settings.from_dict,
+                {
+                    "pdf_password": "dict_password",
+                    "chunk_size_mb": 15,
+                    "max_retries": 7,
+                },
+                {
+                    "pdf_password": "dict_password",
+                    "chunk_size_mb": 15,
+                    "max_retries": 7,
+                    # Other values should be defaults
+                    "log_level": "INFO",
+                },
+                id="from_dict",
+            ),
+        ],
+    )
+    def test_settings_init(self, factory, data, expected):
+        """Test Settings creation with default, custom and dictionary values."""
+        settings_dict = factory(data).to_dict()
+        
+        assert {key: settings_dict[key] for key in expected} == expected
 
     def test_settings_from_env_default(self, sample_environment):
         """Test Settings creation from environment variables (default)."""
-        settings_obj = Settings.from_env()
+        settings_obj = Settings.from_env(env=sample_environment)
         
         assert settings_obj.pdf_password == "test123"
         assert settings_obj.chunk_size_mb == 5
@@ -64,14 +97,13 @@ class TestSettings:
             "LOG_LEVEL": "DEBUG",
         }
         
-        with patch.dict(os.environ, env_vars):
-            settings_obj = Settings.from_env()
-            
-            assert settings_obj.pdf_password == "env_password"
-            assert settings_obj.log_level == "DEBUG"
-            # Other values should be defaults
-            assert settings_obj.chunk_size_mb == 5
-            assert settings_obj.currency_symbol == "KES"
+        settings_obj = Settings.from_env(env=env_vars)
+        
+        assert settings_obj.pdf_password == "env_password"
+        assert settings_obj.log_level == "DEBUG"
+        # Other values should be defaults
+        assert settings_obj.chunk_size_mb == 5
+        assert settings_obj.currency_symbol == "KES"
 
     def test_settings_from_env_invalid_values(self):
         """Test Settings creation with invalid environment values."""
@@ -80,14 +112,35 @@ class TestSettings:
             "MAX_RETRIES": "zero",
         }
         
-        with patch.dict(os.environ, env_vars):
-            with pytest.raises(ValueError):
-                Settings.from_env()
+        with pytest.raises(ValueError):
+            Settings.from_env(env=env_vars)
+
+    def test_settings_from_records(self):
+        """Test batch Settings creation from a structured array."""
+        records = np.array(
+            [("first", 5, 3, "DEBUG"), ("second", 10, 1, "INFO")],
+            dtype=[
+                ("pdf_password", "U16"),
+                ("chunk_size_mb", "i8"),
+                ("max_retries", "i8"),
+                ("log_level", "U8"),
+            ],
+        )
+        
+        settings_list = Settings.from_records(records)
+        
+        assert [s.pdf_password for s in settings_list] == ["first", "second"]
+        assert [s.chunk_size_mb for s in settings_list] == [5, 10]
+        assert [s.max_retries for s in settings_list] == [3, 1]
+        assert [s.log_level for s in settings_list] == ["DEBUG", "INFO"]
+        assert type(settings_list[0].chunk_size_mb) is int
+        # Other values should be defaults
+        assert settings_list[0].currency_symbol == "KES"
 
-    def test_settings_validate(self):
+    def test_settings_validate(self, make_settings):
         """Test Settings validation."""
         # Valid settings
-        valid_settings = Settings(
+        valid_settings = make_settings(
             pdf_password="test123",
             chunk_size_mb=5,
             max_retries=3,
@@ -95,15 +148,15 @@ class TestSettings:
         assert valid_settings.validate() is True
         
         # Invalid settings
-        invalid_settings = Settings(
+        invalid_settings = make_settings(
             chunk_size_mb=0,  # Invalid: too small
             max_retries=-1,   # Invalid: negative
         )
         assert invalid_settings.validate() is False
 
-    def test_settings_get_log_level(self):
+    def test_settings_get_log_level(self, make_settings):
         """Test log level retrieval."""
-        settings_obj = Settings(log_level="DEBUG")
+        settings_obj = make_settings(log_level="DEBUG")
         assert settings_obj.get_log_level() == "DEBUG"
         
         settings_obj.log_level = "invalid_level"
@@ -147,22 +200,6 @@ class TestSettings:
         assert settings_dict["log_level"] == "DEBUG"
         assert "pdf_password" not in settings_dict.get("to_dict_exclude", [])
 
-    def test_settings_from_dict(self):
-        """Test settings from dictionary creation."""
-        settings_dict = {
-            "pdf_password": "dict_password",
-            "chunk_size_mb": 15,
-            "max_retries": 7,
-        }
-        
-        settings_obj = Settings.from_dict(settings_dict)
-        
-        assert settings_obj.pdf_password == "dict_password"
-        assert settings_obj.chunk_size_mb == 15
-        assert settings_obj.max_retries == 7
-        # Other values should be defaults
-        assert settings_obj.log_level == "INFO"
-
     def test_settings_repr(self):
         """Test Settings string representation."""
         settings_obj = Settings(pdf_password="test123")
@@ -187,9 +224,9 @@ class TestSettings:
         
         assert hash(settings1) == hash(settings2)
 
-    def test_settings_update(self):
+    def test_settings_update(self, make_settings):
         """Test Settings update method."""
-        settings_obj = Settings(pdf_password="original")
+        settings_obj = make_settings(pdf_password="original")
         
         updates = {
             "pdf_password": "updated",
@@ -203,9 +240,9 @@ class TestSettings:
         # Other values should remain unchanged
         assert settings_obj.chunk_size_mb == 5
 
-    def test_settings_clone(self):
+    def test_settings_clone(self, make_settings):
         """Test Settings cloning."""
-        original = Settings(
+        original = make_settings(
             pdf_password="test123",
             chunk_size_mb=10,
             log_level="DEBUG",
@@ -243,29 +280,19 @@ class TestSettings:
         """Test retry delay calculation."""
         settings_obj = Settings(max_retries=3)
         
-        # Test exponential backoff
-        delay1 = settings_obj.get_retry_delay(1)  # First retry
-        delay2 = settings_obj.get_retry_delay(2)  # Second retry
-        delay3 = settings_obj.get_retry_delay(3)  # Third retry
+        # Exponential backoff with a minimum delay of 1 second
+        delays = tuple(settings_obj.get_retry_delay(attempt) for attempt in range(0, 6))
         
-        assert delay1 < delay2 < delay3  # Increasing delays
-        assert delay1 >= 1  # Minimum delay of 1 second
+        assert delays == (1, 1, 2, 4, 8, 16)
 
 
 class TestConfigModule:
     """Test cases for config module-level functions."""
 
-    def test_load_config_from_file(self, temp_dir):
+    def test_load_config_from_file(self, temp_dir, sample_config_bytes):
         """Test loading configuration from file."""
         config_file = temp_dir / "test_config.json"
-        config_content = {
-            "pdf_password": "file_password",
-            "chunk_size_mb": 10,
-            "log_level": "DEBUG",
-        }
-        
-        import json
-        config_file.write_text(json.dumps(config_content))
+        config_file.write_bytes(sample_config_bytes)
         
         loaded_config = settings.load_config_from_file(str(config_file))
         
@@ -290,7 +317,6 @@ class TestConfigModule:
         
         assert config_file.exists()
         
-        import json
         saved_config = json.loads(config_file.read_text())
         assert saved_config["pdf_password"] == "save_password"
         assert saved_config["chunk_size_mb"] == 15
@@ -366,7 +392,6 @@ class TestConfigModule:
             "chunk_size_mb": 8,
         }
         
-        import json
         config_file.write_text(json.dumps(config_content))
         
         # Test loading from workspace
@@ -52,9 +52,9 @@ class TestExcelConverter:
         converter.add_summary_data(sheet, sample_excel_data["summary"])
         
         # Check that data was added (verify specific cells)
-        assert sheet.cell(row=2, column=2).value == sample_excel_data["summary"]["total_credits"]
-        assert sheet.cell(row=3, column=2).value == sample_excel_data["summary"]["total_debits"]
-        assert sheet.cell(row=4, column=2).value == sample_excel_data["summary"]["net_amount"]
+        assert sheet["B2"].value == sample_excel_data["summary"]["total_credits"]
+        assert sheet["B3"].value == sample_excel_data["summary"]["total_debits"]
+        assert sheet["B4"].value == sample_excel_data["summary"]["net_amount"]
 
     def test_add_transaction_data(self, sample_settings, sample_transactions):
         """Test adding transaction data to workbook."""
@@ -65,14 +65,14 @@ class TestExcelConverter:
         converter.add_transaction_data(sheet, sample_transactions)
         
         # Check header row
-        assert sheet.cell(row=1, column=1).value == "Date"
-        assert sheet.cell(row=1, column=2).value == "Description"
-        assert sheet.cell(row=1, column=3).value == "Amount"
+        assert sheet["A1"].value == "Date"
+        assert sheet["B1"].value == "Description"
+        assert sheet["C1"].value == "Amount"
         
         # Check first data row
-        assert sheet.cell(row=2, column=1).value == sample_transactions[0]["date"]
-        assert sheet.cell(row=2, column=2).value == sample_transactions[0]["description"]
-        assert sheet.cell(row=2, column=3).value == sample_transactions[0]["amount"]
+        assert sheet["A2"].value == sample_transactions[0]["date"]
+        assert sheet["B2"].value == sample_transactions[0]["description"]
+        assert sheet["C2"].value == sample_transactions[0]["amount"]
 
     def test_add_monthly_breakdown(self, sample_settings, sample_excel_data):
         """Test adding monthly breakdown to workbook."""
@@ -85,9 +85,9 @@ class TestExcelConverter:
         # Find the monthly breakdown section (should start after row 10)
         monthly_data_found = False
         for row in range(10, 20):
-            if sheet.cell(row=row, column=1).value == "2023-01":
+            if sheet[f"A{row}"].value == "2023-01":
                 monthly_data_found = True
-                assert sheet.cell(row=row, column=2).value == sample_excel_data["monthly_breakdown"]["2023-01"]["credits"]
+                assert sheet[f"B{row}"].value == sample_excel_data["monthly_breakdown"]["2023-01"]["credits"]
                 break
         
         assert monthly_data_found, "Monthly breakdown data not found in sheet"
@@ -101,7 +101,7 @@ class TestExcelConverter:
         
         # Check that header cells are styled
         summary_sheet = workbook["Summary"]
-        header_cell = summary_sheet.cell(row=1, column=1)
+        header_cell = summary_sheet["A1"]
         
         assert header_cell.font.bold is True
         assert header_cell.fill.start_color.rgb == "FF4472C4"  # Blue background
@@ -257,9 +257,8 @@ class TestExcelGenerator:
         assert generator.converter is not None
         assert generator.summarizer is not None
 
-    def test_generate_excel_report(self, sample_settings, sample_transactions, temp_dir):
+    def test_generate_excel_report(self, generator, sample_transactions, temp_dir):
         """Test complete Excel report generation."""
-        generator = ExcelGenerator(sample_settings)
         output_file = temp_dir / "test_report.xlsx"
         
         result = generator.generate_excel_report(sample_transactions, str(output_file))
@@ -268,9 +267,8 @@ class TestExcelGenerator:
         assert Path(output_file).exists()
         assert Path(output_file).stat().st_size > 0
 
-    def test_generate_excel_report_with_empty_transactions(self, sample_settings, temp_dir):
+    def test_generate_excel_report_with_empty_transactions(self, generator, temp_dir):
         """Test Excel report generation with empty transactions."""
-        generator = ExcelGenerator(sample_settings)
         output_file = temp_dir / "empty_report.xlsx"
         
         result = generator.generate_excel_report([], str(output_file))
@@ -278,17 +276,15 @@ class TestExcelGenerator:
         assert result == str(output_file)
         assert Path(output_file).exists()
 
-    def test_generate_excel_report_file_creation_error(self, sample_settings, sample_transactions):
+    def test_generate_excel_report_file_creation_error(self, generator, sample_transactions):
         """Test Excel report generation with file creation error."""
-        generator = ExcelGenerator(sample_settings)
         output_file = "/nonexistent/path/report.xlsx"
         
         with pytest.raises(ExcelGenerationError):
             generator.generate_excel_report(sample_transactions, output_file)
 
-    def test_generate_excel_report_with_metadata(self, sample_settings, sample_transactions, temp_dir):
+    def test_generate_excel_report_with_metadata(self, generator, sample_transactions, temp_dir):
         """Test Excel report generation with metadata."""
-        generator = ExcelGenerator(sample_settings)
         output_file = temp_dir / "metadata_report.xlsx"
         
         # Add metadata to transactions
@@ -310,10 +306,8 @@ class TestExcelGenerator:
         assert result == str(output_file)
         assert Path(output_file).exists()
 
-    def test_validate_output_path(self, sample_settings, temp_dir):
+    def test_validate_output_path(self, generator, temp_dir):
         """Test output path validation."""
-        generator = ExcelGenerator(sample_settings)
-        
         # Valid path
         valid_path = temp_dir / "test.xlsx"
         assert generator.validate_output_path(str(valid_path)) is True
@@ -326,10 +320,8 @@ class TestExcelGenerator:
         invalid_ext = temp_dir / "test.txt"
         assert generator.validate_output_path(str(invalid_ext)) is False
 
-    def test_get_default_output_filename(self, sample_settings):
+    def test_get_default_output_filename(self, generator):
         """Test default output filename generation."""
-        generator = ExcelGenerator(sample_settings)
-        
         filename = generator.get_default_output_filename()
         
         assert filename.endswith(".xlsx")
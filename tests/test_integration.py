@@ -494,8 +494,6 @@ class TestConfiguration:
 
     def test_environment_configuration_override(self, temp_dir):
         """Test environment variable configuration override."""
-        import os
-        
         # Set environment variables
         env_vars = {
             "CURRENCY_SYMBOL": "EUR",
@@ -503,9 +501,8 @@ class TestConfiguration:
             "LOG_LEVEL": "DEBUG",
         }
         
-        with patch.dict(os.environ, env_vars):
-            settings = Settings.from_env()
-            
-            assert settings.currency_symbol == "EUR"
-            assert settings.chunk_size_mb == 15
-            assert settings.log_level == "DEBUG"
\ No newline at end of file
+        settings = Settings.from_env(env=env_vars)
+        
+        assert settings.currency_symbol == "EUR"
+        assert settings.chunk_size_mb == 15
+        assert settings.log_level == "DEBUG"
\ No newline at end of file
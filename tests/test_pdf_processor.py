@@ -1,6 +1,8 @@
 """Tests for PDF processing modules."""
 
+import contextlib
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, mock_open
 from pathlib import Path
 import PyPDF2
@@ -8,7 +10,7 @@ import pdfplumber
 
 from src.pdf_processor.decryptor import PDFDecryptor
 from src.pdf_processor.chunker import PDFChunker
-from src.pdf_processor.extractor import TableExtractor
+from src.pdf_processor.extractor import PDFExtractor, TableExtractor
 from src.pdf_processor import PDFProcessor
 from src.utils.exceptions import PDFProcessingError, DecryptionError
 
@@ -159,6 +161,50 @@ class TestTableExtractor:
                 extractor.extract_tables("corrupted.pdf")
 
 
+class TestPDFExtractor:
+    """Test cases for PDFExtractor page-range extraction."""
+
+    HEADER = ["Receipt No.", "Completion Time", "Details", "Transaction Status",
+              "Paid In", "Withdrawn", "Balance"]
+
+    def _row(self, day, amount):
+        return [f"RCP{day}", f"2023-01-{day:02d} 10:00:00", "Payment", "Completed",
+                f"{amount:.2f}", "", "1000.00"]
+
+    def _open_pdf_stub(self, page_tables):
+        """Build an _open_pdf replacement serving one table per page."""
+        def open_pdf(pdf_path, password=None, pages=None):
+            numbers = pages or range(1, len(page_tables) + 1)
+            return contextlib.nullcontext(SimpleNamespace(pages=[
+                SimpleNamespace(
+                    page_number=n,
+                    extract_tables=lambda n=n: [page_tables[n - 1]],
+                    extract_text_simple=lambda: "",
+                )
+                for n in numbers
+            ]))
+        return open_pdf
+
+    def test_split_ranges_match_sequential_with_header_on_first_page_only(self):
+        """Test a table spanning 3 pages yields the same rows split as [1], [2, 3]."""
+        extractor = PDFExtractor()
+        page_tables = [
+            [self.HEADER, self._row(1, 100)],
+            [self._row(2, 200)],
+            [self._row(3, 300)],
+        ]
+
+        with patch.object(extractor, "_open_pdf", side_effect=self._open_pdf_stub(page_tables)):
+            sequential = extractor._extract_raw_transactions("test.pdf")
+            split = (
+                extractor._extract_raw_transactions("test.pdf", pages=[1])
+                + extractor._extract_raw_transactions("test.pdf", pages=[2, 3])
+            )
+
+        assert [t.to_dict() for t in split] == [t.to_dict() for t in sequential]
+        assert [t.credit for t in split] == [100.0, 200.0, 300.0]
+
+
 class TestPDFProcessor:
     """Test cases for PDFProcessor class."""
 